@@ -3,6 +3,8 @@ Configuration module for n8n Summarizer v6.0
 """
 
 import os
+from collections import namedtuple
+
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -45,31 +47,38 @@ SUPPORTED_EXTENSIONS = [".txt", ".log", ".csv", ".json", ".xml", ".srt", ".docx"
 # Theme Configuration
 DEFAULT_THEME = os.getenv("APP_THEME", "light")  # 'light' or 'dark'
 
+# Theme colors, read as attributes (colors.bg_primary)
+Theme = namedtuple(
+    "Theme",
+    "bg_primary bg_secondary text_primary text_secondary accent accent_light "
+    "border button_bg button_hover",
+)
+
 # Light Mode Colors
-LIGHT_THEME = {
-    "bg_primary": "#f7f9fb",
-    "bg_secondary": "#ffffff",
-    "text_primary": "#1f2329",
-    "text_secondary": "#616061",
-    "accent": "#5e5240",  # Brown
-    "accent_light": "#e8dfd5",
-    "border": "#d1d2d3",
-    "button_bg": "#f7f9fb",
-    "button_hover": "#e8e9eb",
-}
+LIGHT_THEME = Theme(
+    bg_primary="#f7f9fb",
+    bg_secondary="#ffffff",
+    text_primary="#1f2329",
+    text_secondary="#616061",
+    accent="#5e5240",  # Brown
+    accent_light="#e8dfd5",
+    border="#d1d2d3",
+    button_bg="#f7f9fb",
+    button_hover="#e8e9eb",
+)
 
 # Dark Mode Colors (Slack-inspired with pure black accents)
-DARK_THEME = {
-    "bg_primary": "#1a1d21",  # Dark gray (not pure black)
-    "bg_secondary": "#222529",  # Slightly lighter gray
-    "text_primary": "#e8e8e8",  # Almost white, very light gray
-    "text_secondary": "#9ca3af",  # Medium gray for secondary text
-    "accent": "#000000",  # Pure black for section labels
-    "accent_light": "#1a1a1a",  # Very dark gray for hover
-    "border": "#374151",  # Dark border
-    "button_bg": "#2d3139",  # Button background
-    "button_hover": "#383c45",  # Button hover
-}
+DARK_THEME = Theme(
+    bg_primary="#1a1d21",  # Dark gray (not pure black)
+    bg_secondary="#222529",  # Slightly lighter gray
+    text_primary="#e8e8e8",  # Almost white, very light gray
+    text_secondary="#9ca3af",  # Medium gray for secondary text
+    accent="#000000",  # Pure black for section labels
+    accent_light="#1a1a1a",  # Very dark gray for hover
+    border="#374151",  # Dark border
+    button_bg="#2d3139",  # Button background
+    button_hover="#383c45",  # Button hover
+)
 
 # Logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -26,7 +26,6 @@ from threading import Thread
 from typing import List, Tuple
 from datetime import datetime
 import logging
-from docx import Document
 
 from models.n8n_model import N8NModel
 from utils.file_scanner import FileScanner
@@ -312,6 +311,9 @@ class BulkSummarizerController:
                     return content
 
             elif suffix == ".docx":
+                # Imported here so python-docx (and lxml) only load when needed
+                from docx import Document
+
                 doc = Document(file_path)
                 content = "\n".join([para.text for para in doc.paragraphs])
                 logger.debug(f"Read {file_path.name} (DOCX): {len(content)} chars")
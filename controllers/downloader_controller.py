@@ -24,6 +24,12 @@ from typing import Optional
 from models.video_downloader import VideoDownloader
 from utils.logger import logger
 
+# Progress line shown while downloading; formatted once per yt-dlp hook call
+_PROGRESS_TEMPLATE = (
+    "Downloading: {percent:.1f}% ({done:.1f}/{total:.1f} MB) - {speed:.2f} MB/s"
+)
+_PROGRESS_ETA_TEMPLATE = _PROGRESS_TEMPLATE + " - ETA: {eta}s"
+
 
 class DownloaderController:
     """Controller for video downloader operations.
@@ -309,15 +315,14 @@ Views: {views_str}
             
             # Format for display
             if total > 0:
-                percent = (downloaded / total) * 100
-                downloaded_mb = downloaded / (1024 * 1024)
-                total_mb = total / (1024 * 1024)
-                speed_mb = speed / (1024 * 1024) if speed else 0
-                
-                progress_text = f"Downloading: {percent:.1f}% ({downloaded_mb:.1f}/{total_mb:.1f} MB) - {speed_mb:.2f} MB/s"
-                
-                if eta:
-                    progress_text += f" - ETA: {eta}s"
+                template = _PROGRESS_ETA_TEMPLATE if eta else _PROGRESS_TEMPLATE
+                progress_text = template.format(
+                    percent=(downloaded / total) * 100,
+                    done=downloaded / (1024 * 1024),
+                    total=total / (1024 * 1024),
+                    speed=speed / (1024 * 1024) if speed else 0,
+                    eta=eta,
+                )
                     
                 self.view.update_progress(progress_text)
                 
@@ -35,6 +35,14 @@ class FileController:
         self.file_model = FileModel()
         self.n8n_model = N8NModel()
 
+        # Incremented per file selection so stale background reads are dropped
+        self._load_generation = 0
+
+        # Background work keeping the loading indicator up; a file read
+        # finishing must not re-enable Send while a request is in flight
+        self._reading = False
+        self._sending = False
+
         # Wire up view callbacks
         self.view.on_file_selected = self.handle_file_selected
         self.view.on_send_clicked = self.handle_send_clicked
@@ -46,22 +54,61 @@ class FileController:
 
     def handle_file_selected(self, file_path: str):
         """Handle file selection from view"""
-        # DEBUG: Track which tab is handling this callback (Bug 2 diagnostic)
-        logger.info(f"=" * 70)
-        logger.info(f"[FILE TAB] File selected: {file_path}")
-        logger.info(f"[FILE TAB] View ID: {id(self.view)}")
-        logger.info(f"[FILE TAB] Controller ID: {id(self)}")
-        logger.info(f"=" * 70)
+        logger.info("[FILE TAB] File selected: %s", file_path)
+        # Track which tab is handling this callback (Bug 2 diagnostic)
+        logger.debug(
+            "[FILE TAB] View ID: %s, Controller ID: %s", id(self.view), id(self)
+        )
+
+        # Read on a worker thread so large files don't freeze the UI
+        self._load_generation += 1
+        self.view.set_status(f"Loading: {os.path.basename(file_path)}")
+        self._reading = True
+        self._update_loading()
 
-        # Use model to read file
-        success, content, error = self.file_model.read_file(file_path)
+        thread = threading.Thread(
+            target=self._read_file_thread,
+            args=(file_path, self._load_generation),
+            daemon=True,
+        )
+        thread.start()
+
+    def _read_file_thread(self, file_path: str, generation: int):
+        """Background thread function to read the selected file"""
+        try:
+            success, content, error = self.file_model.read_file(file_path)
+            info = self.file_model.get_file_info(file_path, content) if success else None
+        except Exception as e:
+            # Always report back, or the loading state would never clear
+            logger.error("Unexpected error reading %s: %s", file_path, e)
+            success, content, error, info = False, "", str(e), None
+
+        # Schedule UI update on main thread
+        self.view.root.after(
+            0, self._on_file_read, file_path, generation, success, content, error, info
+        )
+
+    def _on_file_read(
+        self,
+        file_path: str,
+        generation: int,
+        success: bool,
+        content: str,
+        error: str,
+        info: dict,
+    ):
+        """Apply a finished file read to the view (main thread)"""
+        if generation != self._load_generation:
+            # A newer file was selected while this one was reading
+            logger.debug("Discarding stale file read: %s", file_path)
+            return
+
+        self._reading = False
+        self._update_loading()
 
         if success:
             self.view.set_file_path(file_path)
             self.view.set_content(content)
-
-            # Get file info from model
-            info = self.file_model.get_file_info(file_path)
             self.view.set_file_info(info)
             self.view.set_status(f"Loaded: {info['name']}")
         else:
@@ -70,6 +117,10 @@ class FileController:
             self.view.set_content("")
             self.view.set_file_info(None)
 
+    def _update_loading(self):
+        """Show the loading indicator while a file read or n8n send runs"""
+        self.view.show_loading(self._reading or self._sending)
+
     def handle_send_clicked(self, allow_textbox_only=False):
         """Handle Send to n8n button - starts background thread"""
         logger.info("Send button clicked")
@@ -89,11 +140,6 @@ class FileController:
         if not file_path and allow_textbox_only:
             logger.info("Using textbox content (no file loaded)")
 
-        content = self.view.get_content()
-        if not content or not content.strip():
-            self.view.show_error("File content is empty. Cannot send empty content.")
-            return
-
         # Get webhook from GUI (with override support)
         webhook_override = self.view.get_webhook_override()
         gui_webhook_url = webhook_override["custom_url"]
@@ -117,8 +163,17 @@ class FileController:
         except Exception as e:
             logger.error(f"Failed to save export preferences: {e}")
 
-        # Get file info for display
-        file_info = self.file_model.get_file_info(file_path)
+        # Get file info for display (textbox-only mode has no file to stat)
+        if file_path:
+            file_info = self.file_model.get_file_info(file_path, content)
+        else:
+            size = len(content.encode("utf-8"))
+            file_info = {
+                "name": "Textbox content",
+                "size": size,
+                "size_kb": size / 1024,
+                "lines": len(content.split("\n")),
+            }
         status_msg = (
             f"Sending request to n8n...\n\n"
             f"Webhook: {gui_webhook_url}\n"
@@ -128,7 +183,8 @@ class FileController:
         )
         self.view.display_response(status_msg)
         self.view.set_status("Sending to n8n and waiting for response...")
-        self.view.show_loading(True)
+        self._sending = True
+        self._update_loading()
 
         # Send in background thread
         thread = threading.Thread(
@@ -159,7 +215,9 @@ class FileController:
             logger.info(f"Using webhook from GUI: {webhook_url}")
 
             # Get actual file size in bytes
-            file_size_bytes = os.path.getsize(file_path)
+            file_size_bytes = (
+                os.path.getsize(file_path) if file_path else file_info["size"]
+            )
             logger.debug(
                 f"File size: {file_size_bytes} bytes ({file_size_bytes / 1024:.1f} KB)"
             )
@@ -225,7 +283,8 @@ class FileController:
 
         self.view.show_success(success_msg)
         self.view.set_status("Ready")
-        self.view.show_loading(False)
+        self._sending = False
+        self._update_loading()
 
     def _on_success_no_summary(self, file_name: str, saved_msg: str):
         """Handle successful send with no summary in response"""
@@ -234,14 +293,16 @@ class FileController:
         )
         self.view.show_success(f"Successfully sent '{file_name}' to n8n!{saved_msg}")
         self.view.set_status("Ready")
-        self.view.show_loading(False)
+        self._sending = False
+        self._update_loading()
 
     def _on_error(self, error_msg: str):
         """Handle error response"""
         self.view.display_response(f"Error occurred:\n\n{error_msg}")
         self.view.show_error(f"Failed to send to n8n:\n{error_msg}")
         self.view.set_status("Ready")
-        self.view.show_loading(False)
+        self._sending = False
+        self._update_loading()
 
     def handle_export_txt(self, manual_call: bool = True):
         """Export response content as .txt file"""
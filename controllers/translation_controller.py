@@ -36,6 +36,11 @@ class TranslationController:
         self.translation_thread = None
         self.translation_queue = queue.Queue()
 
+        # File loading runs on worker threads; only the latest selection is shown
+        self.load_queue = queue.Queue()
+        self._loading_file_path = None
+        self._load_polling = False
+
         # Wire up view callbacks
         self.view.on_file_selected = self.handle_file_selected
         self.view.on_translate_clicked = self.handle_translate_clicked
@@ -49,11 +54,54 @@ class TranslationController:
 
     def handle_file_selected(self, file_path: str):
         """Handle file selection from view"""
-        logger.info(f"File selected for translation: {file_path}")
+        logger.info("File selected for translation: %s", file_path)
+
+        # Read the file off the Tk thread so large files don't freeze the UI
+        self._loading_file_path = file_path
+        self.view.set_status(f"Loading: {os.path.basename(file_path)}...")
+        threading.Thread(
+            target=self._load_worker, args=(file_path,), daemon=True
+        ).start()
+
+        if not self._load_polling:
+            self._load_polling = True
+            self._check_load_result()
+
+    def _load_worker(self, file_path: str):
+        """Worker thread for reading the selected file"""
+        try:
+            result = self.model.load_file_content(file_path)
+        except Exception as e:
+            result = (False, "", str(e))
+        self.load_queue.put((file_path, result))
+
+    def _check_load_result(self):
+        """Show the selected file once its worker has read it"""
+        while True:
+            try:
+                file_path, result = self.load_queue.get_nowait()
+            except queue.Empty:
+                break
+            # Results of earlier, superseded selections are dropped
+            if file_path == self._loading_file_path:
+                self._loading_file_path = None
+                self._show_loaded_file(file_path, *result)
+
+        if self._loading_file_path is not None:
+            self.view.root.after(50, self._check_load_result)
+        else:
+            self._load_polling = False
 
-        # Use model to read file
-        success, content, error = self.model.load_file_content(file_path)
+    def _show_loaded_file(self, file_path: str, success: bool, content: str, error):
+        """
+        Update the view with the result of loading a file.
 
+        Args:
+            file_path: Path of the loaded file
+            success: Whether the file could be read
+            content: File text (empty on failure)
+            error: Error message on failure
+        """
         if success:
             self.view.set_file_path(file_path)
             self.view.set_source_text(content)
@@ -71,8 +119,8 @@ class TranslationController:
         logger.info("Translate button clicked")
 
         # Validate we have content to translate
-        source_text = self.view.get_source_text()
-        if not source_text or not source_text.strip():
+        source_text = self.view.get_source_text()  # Already stripped
+        if not source_text:
             self.view.show_error(
                 "No text to translate. Please load a file or enter text."
             )
@@ -85,7 +133,7 @@ class TranslationController:
         else:
             default_url = self.model.restore_default_webhook()
             self.view.set_webhook_url(default_url)
-            logger.info(f"Webhook field was empty, using default: {default_url}")
+            logger.info("Webhook field was empty, using default: %s", default_url)
 
         # Get target language
         target_language = self.view.get_target_language()
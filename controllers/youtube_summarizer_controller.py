@@ -135,6 +135,7 @@ class YouTubeSummarizerController:
         # Update UI
         self.view.set_input_status("Transcribing YouTube video...", "blue")
         self.view.set_summarize_button_enabled(False)
+        self.view.set_format_enabled(False)
         self.view.set_export_buttons_enabled(False)
         self.view.set_summary_content("Transcribing YouTube video...\nThis may take a few minutes depending on video length.")
         
@@ -237,6 +238,7 @@ class YouTubeSummarizerController:
         self.view.show_error(f"Transcription failed:\n\n{error_msg}")
         self.view.set_input_status("Transcription failed", "red")
         self.view.set_summarize_button_enabled(True)
+        self.view.set_format_enabled(True)
         self.view.set_summary_content(
             f"Error during transcription:\n\n{error_msg}\n\n"
             f"Please try again."
@@ -347,6 +349,7 @@ class YouTubeSummarizerController:
         self.view.set_output_status("Summary ready. You can now export or copy.", "green")
         self.view.set_export_buttons_enabled(True)
         self.view.set_summarize_button_enabled(True)
+        self.view.set_format_enabled(True)
         
         # Forward transcript to Transcriber tab (if available)
         if self.transcriber_tab and self.current_transcript:
@@ -388,6 +391,7 @@ class YouTubeSummarizerController:
         self.view.set_input_status("Summarization failed", "red")
         self.view.set_output_status(f"Error: {error_msg}", "red")
         self.view.set_summarize_button_enabled(True)
+        self.view.set_format_enabled(True)
     
     def _forward_transcript_to_transcriber_view(self):
         """
@@ -400,18 +404,13 @@ class YouTubeSummarizerController:
             return
         
         try:
-            # Check if Transcriber tab has a transcript_text widget
-            if hasattr(self.transcriber_tab, 'transcript_text'):
-                # Set the transcript content in Transcriber tab
-                transcript_text_widget = self.transcriber_tab.transcript_text
-                transcript_text_widget.config(state=tk.NORMAL)
-                transcript_text_widget.delete("1.0", tk.END)
-                transcript_text_widget.insert(tk.END, self.current_transcript)
-                transcript_text_widget.config(state=tk.DISABLED)
+            # Go through set_transcript() so only the changed range is redrawn
+            if hasattr(self.transcriber_tab, 'set_transcript'):
+                self.transcriber_tab.set_transcript(self.current_transcript)
                 
                 logger.info("Transcript forwarded to Transcriber tab view")
             else:
-                logger.warning("Transcriber tab does not have transcript_text widget")
+                logger.warning("Transcriber tab does not have set_transcript")
         except Exception as e:
             logger.error(f"Error forwarding transcript to Transcriber tab view: {str(e)}")
     
@@ -535,7 +534,6 @@ class YouTubeSummarizerController:
                 # Fallback to tkinter clipboard
                 self.view.root.clipboard_clear()
                 self.view.root.clipboard_append(self.current_summary)
-                self.view.root.update()
                 logger.info("Summary copied to clipboard (tkinter fallback)")
             
             self.view.show_success(f"Summary copied to clipboard ({len(self.current_summary)} characters)")
@@ -545,7 +543,3 @@ class YouTubeSummarizerController:
             error_msg = f"Failed to copy to clipboard: {str(e)}"
             logger.error(error_msg)
             self.view.show_error(error_msg)
-
-
-# Import tk for transcript forwarding
-import tkinter as tk
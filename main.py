@@ -22,12 +22,6 @@ Updated: 2026-04-26 - Video Subtitler feature
 import tkinter as tk
 from views.main_window import MainWindow
 from controllers.file_controller import FileController
-from controllers.youtube_summarizer_controller import YouTubeSummarizerController
-from controllers.transcriber_controller import TranscriberController
-from controllers.bulk_summarizer_controller import BulkSummarizerController
-from controllers.bulk_transcriber_controller import BulkTranscriberController
-from controllers.translation_controller import TranslationController
-from controllers.video_subtitler_controller import VideoSubtitlerController
 from utils.logger import logger
 from utils.settings_manager import SettingsManager
 from config import APP_TITLE
@@ -41,12 +35,13 @@ def main():
     - SettingsManager (persistent user preferences)
     - MainWindow (views layer with all tabs)
     - FileController (coordinates FileTab + models)
-    - TranscriberController (coordinates TranscriberTab + models)
-    - YouTubeSummarizerController (coordinates YouTubeSummarizerTab + models)
-    - BulkSummarizerController (coordinates BulkSummarizerTab + models)
-    - BulkTranscriberController (coordinates BulkTranscriberTab + models)
-    - TranslationController (coordinates TranslationTab + TranslationModel)
-    - DownloaderTab with persistent settings
+    - TranscriberController (coordinates TranscriberTab + models, on first use)
+    - YouTubeSummarizerController (coordinates YouTubeSummarizerTab + models, on first use)
+    - BulkSummarizerController (coordinates BulkSummarizerTab + models, on first use)
+    - BulkTranscriberController (coordinates BulkTranscriberTab + models, on first use)
+    - TranslationController (coordinates TranslationTab + TranslationModel, on first use)
+    - VideoSubtitlerController (coordinates VideoSubtitlerTab + models, on first use)
+    - DownloaderTab with persistent settings (on first use)
 
     Features (v6.3):
     - File summarization (txt, srt, docx, pdf)
@@ -80,52 +75,88 @@ def main():
         file_controller = FileController(window.file_tab)
         logger.info("FileController initialized")
 
-        # Initialize Transcriber tab controller FIRST (so it's available for YouTube controller)
-        # Wires: TranscriberTab UI ↔ TranscriberController ↔ TranscribeModel + N8NModel
-        transcriber_controller = TranscriberController(window.transcriber_tab, settings)
-        logger.info("TranscriberController initialized")
-
-        # Initialize YouTube Summarizer tab controller
-        # Wires: YouTubeSummarizerTab UI ↔ YouTubeSummarizerController ↔ TranscribeModel + N8NModel
-        # Pass BOTH transcriber_tab reference (for UI) AND transcriber_controller
-        youtube_summarizer_controller = YouTubeSummarizerController(
-            window.youtube_summarizer_tab,
-            transcriber_tab=window.transcriber_tab,
-            transcriber_controller=transcriber_controller,
-        )
-        logger.info("YouTubeSummarizerController initialized")
-
-        # Initialize Bulk Summarizer tab controller
-        # Wires: BulkSummarizerTab UI ↔ BulkSummarizerController
-        # With advanced options: file types, output formats, custom location
-        bulk_summarizer_controller = BulkSummarizerController(
-            window.bulk_summarizer_tab
-        )
-        logger.info("BulkSummarizerController initialized")
-
-        # Initialize Bulk Transcriber tab controller
-        # Wires: BulkTranscriberTab UI ↔ BulkTranscriberController
-        # With media format selection, output formats, recursive scanning
-        bulk_transcriber_controller = BulkTranscriberController(
-            window.bulk_transcriber_tab
-        )
-        logger.info("BulkTranscriberController initialized")
-
-        # Initialize Translation tab controller
-        # Wires: TranslationTab UI ↔ TranslationController ↔ TranslationModel
-        translation_controller = TranslationController(window.translation_tab)
-        logger.info("TranslationController initialized")
-
-        # Initialize Video Subtitler tab controller
-        # Wires: VideoSubtitlerTab UI ↔ VideoSubtitlerController ↔ VideoSubtitlerModel
-        video_subtitler_controller = VideoSubtitlerController(window.video_subtitler_tab, settings)
-        logger.info("VideoSubtitlerController initialized")
-
-        # Downloader tab controller already initialized in DownloaderTab.__init__
-        # Now inject settings manager into it
-        if hasattr(window, "downloader_tab") and window.downloader_tab.controller:
-            window.downloader_tab.controller.set_settings_manager(settings)
-            logger.info("DownloaderController configured with SettingsManager")
+        # Every tab except File Summarizer is built on first use, so the
+        # other controllers are wired when their tab is created
+        lazy_controllers = {}
+
+        def wire_transcriber(tab):
+            # Wires: TranscriberTab UI ↔ TranscriberController ↔ TranscribeModel + N8NModel
+            from controllers.transcriber_controller import TranscriberController
+
+            lazy_controllers["transcriber"] = TranscriberController(tab, settings)
+            logger.info("TranscriberController initialized")
+
+        def wire_youtube_summarizer(tab):
+            # Wires: YouTubeSummarizerTab UI ↔ YouTubeSummarizerController ↔ TranscribeModel + N8NModel
+            # Needs BOTH transcriber_tab reference (for UI) AND transcriber_controller,
+            # so the Transcriber tab is built (and wired) first if needed
+            from controllers.youtube_summarizer_controller import (
+                YouTubeSummarizerController,
+            )
+
+            transcriber_tab = window.get_tab("transcriber_tab")
+            lazy_controllers["youtube_summarizer"] = YouTubeSummarizerController(
+                tab,
+                transcriber_tab=transcriber_tab,
+                transcriber_controller=lazy_controllers["transcriber"],
+            )
+            logger.info("YouTubeSummarizerController initialized")
+
+        window.on_tab_created("transcriber_tab", wire_transcriber)
+        window.on_tab_created("youtube_summarizer_tab", wire_youtube_summarizer)
+
+        def wire_bulk_summarizer(tab):
+            # Wires: BulkSummarizerTab UI ↔ BulkSummarizerController
+            # With advanced options: file types, output formats, custom location
+            from controllers.bulk_summarizer_controller import (
+                BulkSummarizerController,
+            )
+
+            lazy_controllers["bulk_summarizer"] = BulkSummarizerController(tab)
+            logger.info("BulkSummarizerController initialized")
+
+        window.on_tab_created("bulk_summarizer_tab", wire_bulk_summarizer)
+
+        def wire_bulk_transcriber(tab):
+            # Wires: BulkTranscriberTab UI ↔ BulkTranscriberController
+            # With media format selection, output formats, recursive scanning
+            from controllers.bulk_transcriber_controller import (
+                BulkTranscriberController,
+            )
+
+            lazy_controllers["bulk_transcriber"] = BulkTranscriberController(tab)
+            logger.info("BulkTranscriberController initialized")
+
+        def wire_translation(tab):
+            # Wires: TranslationTab UI ↔ TranslationController ↔ TranslationModel
+            from controllers.translation_controller import TranslationController
+
+            lazy_controllers["translation"] = TranslationController(tab)
+            logger.info("TranslationController initialized")
+
+        window.on_tab_created("bulk_transcriber_tab", wire_bulk_transcriber)
+        window.on_tab_created("translation_tab", wire_translation)
+
+        def wire_video_subtitler(tab):
+            # Wires: VideoSubtitlerTab UI ↔ VideoSubtitlerController ↔ VideoSubtitlerModel
+            from controllers.video_subtitler_controller import (
+                VideoSubtitlerController,
+            )
+
+            lazy_controllers["video_subtitler"] = VideoSubtitlerController(
+                tab, settings
+            )
+            logger.info("VideoSubtitlerController initialized")
+
+        def wire_downloader(tab):
+            # Downloader tab controller already initialized in DownloaderTab.__init__
+            # Now inject settings manager into it
+            if tab.controller:
+                tab.controller.set_settings_manager(settings)
+                logger.info("DownloaderController configured with SettingsManager")
+
+        window.on_tab_created("video_subtitler_tab", wire_video_subtitler)
+        window.on_tab_created("downloader_tab", wire_downloader)
 
         logger.info("Application ready")
 
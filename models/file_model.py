@@ -189,12 +189,14 @@ class FileModel:
         
         return '\n'.join(subtitles)
     
-    def get_file_info(self, file_path: str) -> dict:
+    def get_file_info(self, file_path: str, content: str = None) -> dict:
         """
         Extract file metadata.
         
         Args:
             file_path (str): Path to file
+            content (str, optional): Already-read file content, to avoid
+                reading the file a second time
             
         Returns:
             dict: File information
@@ -212,10 +214,11 @@ class FileModel:
                 logger.error(f"File not found: {file_path}")
                 return {}
             
-            # Read file to count lines/characters
-            success, content, error = self.read_file(file_path)
-            if not success:
-                return {}
+            # Read file to count lines/characters (unless caller already did)
+            if content is None:
+                success, content, error = self.read_file(file_path)
+                if not success:
+                    return {}
             
             file_stat = os.stat(file_path)
             
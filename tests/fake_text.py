@@ -0,0 +1,73 @@
+"""
+Fake tk.Text widget shared by the Text helper tests
+"""
+import re
+
+
+class FakeText:
+    """
+    Stand-in for tk.Text covering the calls the Text helpers make.
+
+    Supports the "1.0", "end", "end-1c" and "1.0 + N chars" indexes. Like Tk,
+    any insert or delete sets the modified flag, and inserts into a DISABLED
+    widget are ignored. Inserts and deletes are recorded in `calls`.
+    """
+
+    def __init__(self, text=""):
+        self.text = text
+        self.calls = []
+        self.state = "normal"
+        self.modified = False
+        self.options = {}
+        self.gets = 0
+        self.idle_callbacks = []
+        self.tk = self
+
+    def getboolean(self, value):
+        return bool(value)
+
+    def configure(self, **kw):
+        if "state" in kw:
+            self.state = kw.pop("state")
+        self.options.update(kw)
+
+    def cget(self, option):
+        return self.state if option == "state" else self.options[option]
+
+    def edit_modified(self, flag=None):
+        if flag is None:
+            return self.modified
+        self.modified = flag
+
+    def after_idle(self, callback):
+        self.idle_callbacks.append(callback)
+
+    def _offset(self, index):
+        if index in ("end", "end-1c"):
+            return len(self.text)
+        if index == "1.0":
+            return 0
+        match = re.fullmatch(r"1\.0 \+ (\d+) chars", index)
+        if match is None:
+            raise ValueError(f"Unsupported index: {index}")
+        return int(match.group(1))
+
+    def get(self, start, end):
+        self.gets += 1
+        return self.text[self._offset(start) : self._offset(end)]
+
+    def insert(self, index, chars):
+        if self.state == "disabled":
+            return
+        self.calls.append(("insert", index, chars))
+        a = self._offset(index)
+        self.text = self.text[:a] + chars + self.text[a:]
+        self.modified = True
+
+    def delete(self, start, end):
+        if self.state == "disabled":
+            return
+        self.calls.append(("delete", start, end))
+        a, b = self._offset(start), self._offset(end)
+        self.text = self.text[:a] + self.text[b:]
+        self.modified = True
@@ -0,0 +1,144 @@
+"""
+Unit tests for the IncrementalText chunked loader
+"""
+import unittest
+
+from tests.fake_text import FakeText
+from views.incremental_text import IncrementalText
+
+
+class FakeScrollbar:
+    """Records the fractions passed to set()"""
+
+    def __init__(self):
+        self.position = None
+
+    def set(self, first, last):
+        self.position = (first, last)
+
+
+def make_lines(count, prefix="line"):
+    """Build a document of numbered lines"""
+    return "\n".join(f"{prefix} {i}" for i in range(count))
+
+
+class TestIncrementalText(unittest.TestCase):
+    """Test cases for IncrementalText"""
+
+    def setUp(self):
+        """Setup a loader with small chunks and pieces"""
+        self.widget = FakeText()
+        self.scrollbar = FakeScrollbar()
+        self.loader = IncrementalText(self.widget, scrollbar=self.scrollbar, chunk_lines=10)
+        self.loader.PIECE_LINES = 4
+
+    def test_set_small_document(self):
+        """Test that a document within one chunk is inserted whole"""
+        content = make_lines(5)
+        self.loader.set(content)
+
+        self.assertEqual(self.widget.text, content)
+        self.assertFalse(self.widget.modified)
+        self.assertEqual(self.loader.get(), content)
+        self.assertEqual(self.loader.longest_line, len("line 4"))
+
+    def test_set_large_document_inserts_first_chunk(self):
+        """Test that only the first chunk_lines lines reach the widget"""
+        content = make_lines(25)
+        self.loader.set(content)
+
+        self.assertEqual(self.widget.text, make_lines(10))
+        self.assertEqual(self.loader.get(), content)
+        self.assertEqual(self.widget.gets, 0)  # Served from the cache
+
+    def test_load_more_appends_next_chunk(self):
+        """Test that load_more inserts pending pieces until chunk_lines"""
+        content = make_lines(25)
+        self.loader.set(content)
+
+        # Pieces hold 4 lines, so the 10-line chunk takes three of them
+        self.loader.load_more()
+        self.assertEqual(self.widget.text, make_lines(22))
+        self.loader.load_more()
+        self.assertEqual(self.widget.text, content)
+
+        # Loading keeps the cache valid and leaves nothing more to load
+        self.assertFalse(self.widget.modified)
+        self.assertEqual(self.loader.get(), content)
+        self.assertEqual(self.widget.gets, 0)
+        self.loader.load_more()
+        self.assertEqual(self.widget.text, content)
+
+    def test_get_rereads_after_user_edit(self):
+        """Test that the cache is dropped once the modified flag is set"""
+        content = make_lines(15)
+        self.loader.set(content)
+
+        # A user edit in the loaded part sets Tk's modified flag
+        self.widget.insert("1.0", "edited ")
+        result = self.loader.get()
+
+        self.assertEqual(result, "edited " + content)
+        self.assertEqual(self.widget.gets, 1)
+        self.assertFalse(self.widget.modified)
+
+        # Clean again, so the next read is served from the cache
+        self.assertEqual(self.loader.get(), result)
+        self.assertEqual(self.widget.gets, 1)
+
+    def test_set_same_document_is_noop(self):
+        """Test that setting unchanged content touches nothing"""
+        content = make_lines(5)
+        self.loader.set(content)
+        self.widget.text = "sentinel"  # Would be replaced by any rewrite
+
+        self.loader.set(content)
+        self.assertEqual(self.widget.text, "sentinel")
+
+    def test_set_small_change_is_patched(self):
+        """Test that small documents are updated in place"""
+        self.loader.set("alpha\nbeta")
+        self.loader.set("alpha\nbeta\ngamma")
+
+        self.assertEqual(self.widget.text, "alpha\nbeta\ngamma")
+        self.assertEqual(self.loader.get(), "alpha\nbeta\ngamma")
+        self.assertFalse(self.widget.modified)
+
+    def test_set_after_edit_replaces_edited_text(self):
+        """Test that set() rebuilds the widget if the user edited it"""
+        self.loader.set("alpha")
+        self.widget.insert("end", " typed")
+
+        self.loader.set("beta")
+        self.assertEqual(self.widget.text, "beta")
+        self.assertEqual(self.loader.get(), "beta")
+
+    def test_load_more_into_disabled_widget(self):
+        """Test that chunks reach read-only widgets and restore the state"""
+        content = make_lines(15)
+        self.loader.set(content)
+        self.widget.configure(state="disabled")
+        self.loader.load_more()
+
+        self.assertEqual(self.widget.text, content)
+        self.assertEqual(self.widget.state, "disabled")
+        self.assertEqual(self.loader.get(), content)
+
+    def test_scroll_near_end_schedules_one_load(self):
+        """Test that scrolling past the threshold schedules load_more once"""
+        self.loader.set(make_lines(25))
+
+        self.loader._on_yscroll("0.0", "0.5")
+        self.assertEqual(self.widget.idle_callbacks, [])
+        self.assertEqual(self.scrollbar.position, ("0.0", "0.5"))
+
+        self.loader._on_yscroll("0.5", "0.95")
+        self.loader._on_yscroll("0.5", "0.97")
+        self.assertEqual(self.widget.idle_callbacks, [self.loader.load_more])
+
+        self.widget.idle_callbacks.pop()()
+        self.assertEqual(self.widget.text, make_lines(22))
+
+
+if __name__ == '__main__':
+    unittest.main()
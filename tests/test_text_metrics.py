@@ -0,0 +1,78 @@
+"""
+Unit tests for TextMetrics width lookups and label eliding
+"""
+import tkinter.font as tkfont
+import unittest
+
+from views.text_metrics import ELLIPSIS, TextMetrics, _keep_ends
+
+
+class FakeFont(tkfont.Font):
+    """Font with a fixed width per character that records measure() calls"""
+
+    def __init__(self, char_width=10):
+        # No Tk font is created, so there is nothing to delete later
+        self.delete_font = False
+        self.char_width = char_width
+        self.measured = []
+
+    def measure(self, text, displayof=None):
+        self.measured.append(text)
+        return self.char_width * len(text)
+
+
+class TestTextMetrics(unittest.TestCase):
+    """Test cases for TextMetrics"""
+
+    def setUp(self):
+        """Setup metrics for a 10px-per-character font"""
+        self.font = FakeFont(char_width=10)
+        self.metrics = TextMetrics(self.font)
+        self.font.measured.clear()  # Ignore the table built in __init__
+
+    def test_ascii_width_uses_table(self):
+        """Test that ASCII widths are summed without calling Tk"""
+        self.assertEqual(self.metrics.width("report.txt"), 100)
+        self.assertEqual(self.metrics.width(""), 0)
+        self.assertEqual(self.font.measured, [])
+
+    def test_fits_as_is(self):
+        """Test that text within max_width is returned unchanged"""
+        path = "C:/docs/a.txt"
+        self.assertEqual(self.metrics.elide_middle(path, max_width=130), path)
+        self.assertEqual(self.metrics.elide_middle(path, max_width=0), path)
+
+    def test_elides_middle(self):
+        """Test that both ends are kept around a single ellipsis"""
+        path = "C:/folder/subfolder/file.txt"
+        result = self.metrics.elide_middle(path, max_width=120)
+
+        # 120px minus the ellipsis leaves room for 11 characters
+        self.assertEqual(result, "C:/fol" + ELLIPSIS + "e.txt")
+        self.assertLessEqual(self.metrics.width(result), 120)
+
+    def test_elides_to_ellipsis_only(self):
+        """Test eliding when only the ellipsis fits"""
+        self.assertEqual(self.metrics.elide_middle("abcdef", max_width=15), ELLIPSIS)
+
+    def test_non_ascii_falls_back_to_measure(self):
+        """Test that non-ASCII text is measured by the font"""
+        path = "C:/dokumenti/čćž/prijevod.txt"
+        self.assertEqual(self.metrics.width(path), 10 * len(path))
+        self.assertEqual(self.font.measured, [path])
+        self.font.measured.clear()
+
+        # 150px minus the ellipsis leaves room for 14 characters
+        result = self.metrics.elide_middle(path, max_width=150)
+        self.assertEqual(result, "C:/doku" + ELLIPSIS + "vod.txt")
+        self.assertIn(path, self.font.measured)
+
+    def test_keep_ends(self):
+        """Test the head/tail split used by the search"""
+        self.assertEqual(_keep_ends("abcdefgh", 5), "abcgh")
+        self.assertEqual(_keep_ends("abcdefgh", 1), "a")
+        self.assertEqual(_keep_ends("abcdefgh", 0), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Unit tests for the minimal-edit Text helpers in views.text_patch
+"""
+import unittest
+
+from tests.fake_text import FakeText
+from views.text_patch import _common_prefix, _common_suffix, patch_text
+
+
+class TestCommonAffixes(unittest.TestCase):
+    """Test cases for the prefix/suffix scans"""
+
+    def test_common_prefix(self):
+        """Test prefix length for short and empty strings"""
+        self.assertEqual(_common_prefix("hello world", "hello there"), 6)
+        self.assertEqual(_common_prefix("abc", "abc"), 3)
+        self.assertEqual(_common_prefix("abc", "xbc"), 0)
+        self.assertEqual(_common_prefix("", "abc"), 0)
+
+    def test_common_prefix_spans_blocks(self):
+        """Test prefix scan across the 4096-character block boundary"""
+        base = "a" * 5000
+        self.assertEqual(_common_prefix(base + "x", base + "y"), 5000)
+        self.assertEqual(_common_prefix(base, base + "tail"), 5000)
+
+    def test_common_suffix(self):
+        """Test suffix length and the limit argument"""
+        self.assertEqual(_common_suffix("say hello", "to hello", 8), 6)
+        self.assertEqual(_common_suffix("abc", "abd", 3), 0)
+        # The limit keeps the suffix from overlapping the common prefix
+        self.assertEqual(_common_suffix("aaa", "aaaa", 0), 0)
+        self.assertEqual(_common_suffix("aaa", "aaaa", 2), 2)
+
+    def test_common_suffix_spans_blocks(self):
+        """Test suffix scan across the 4096-character block boundary"""
+        base = "b" * 5000
+        self.assertEqual(_common_suffix("x" + base, "y" + base, 5001), 5000)
+
+
+class TestPatchText(unittest.TestCase):
+    """Test cases for patch_text"""
+
+    def assert_patched(self, old, new):
+        widget = FakeText(old)
+        patch_text(widget, old, new)
+        self.assertEqual(widget.text, new)
+        return widget.calls
+
+    def test_append_inserts_only_new_text(self):
+        """Test that an append is a single insert at the end"""
+        calls = self.assert_patched("response", "response\nstatus")
+        self.assertEqual(calls, [("insert", "1.0 + 8 chars", "\nstatus")])
+
+    def test_middle_change_replaces_changed_range(self):
+        """Test that only the differing middle is deleted and inserted"""
+        calls = self.assert_patched("one two three", "one 2 three")
+        self.assertEqual(
+            calls,
+            [
+                ("delete", "1.0 + 4 chars", "1.0 + 7 chars"),
+                ("insert", "1.0 + 4 chars", "2"),
+            ],
+        )
+
+    def test_truncation_only_deletes(self):
+        """Test that removing a tail needs no insert"""
+        calls = self.assert_patched("keep this", "keep")
+        self.assertEqual(calls, [("delete", "1.0 + 4 chars", "1.0 + 9 chars")])
+
+    def test_repeated_characters(self):
+        """Test inputs where prefix and suffix could overlap"""
+        self.assert_patched("aaa", "aaaa")
+        self.assert_patched("aaaa", "aa")
+        self.assert_patched("abab", "ab")
+
+    def test_empty_old_or_new_rewrites(self):
+        """Test the full rewrite path for empty documents"""
+        calls = self.assert_patched("", "text")
+        self.assertEqual(calls, [("delete", "1.0", "end"), ("insert", "1.0", "text")])
+        calls = self.assert_patched("text", "")
+        self.assertEqual(calls, [("delete", "1.0", "end")])
+
+    def test_astral_characters_rewrite(self):
+        """Test that non-BMP text falls back to a full rewrite"""
+        calls = self.assert_patched("smile", "smile \U0001F600")
+        self.assertEqual(calls[0], ("delete", "1.0", "end"))
+
+
+if __name__ == '__main__':
+    unittest.main()
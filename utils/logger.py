@@ -4,9 +4,15 @@ Logging utility module
 v4.4.3: Fixed Unicode encoding issue on Windows console
 Problem: checkmark (✓) and cross (✗) caused UnicodeEncodeError in cp1250 encoding
 Solution: Force UTF-8 encoding for console output
+
+Records are passed through a queue and written by a background listener
+thread, so logging from the Tk main loop never waits on file/console I/O.
 """
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from config import LOG_LEVEL, LOG_FILE
 
@@ -43,6 +49,14 @@ formatter = logging.Formatter(
 file_handler.setFormatter(formatter)
 console_handler.setFormatter(formatter)
 
-# Add handlers
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+# Add handlers - callers only enqueue; the listener thread does the writing
+log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+queue_listener = logging.handlers.QueueListener(
+    log_queue, file_handler, console_handler, respect_handler_level=True
+)
+queue_listener.start()
+
+# Flush queued records on interpreter exit
+atexit.register(queue_listener.stop)
@@ -30,6 +30,8 @@ class BaseTab(ttk.Frame, ABC):
     All tabs should inherit from this class and implement required methods.
     """
 
+    MAX_LOG_LINES = 5000  # Log widgets keep at most this many recent lines
+
     def __init__(self, parent, tab_name: str):
         """
         Initialize base tab.
@@ -46,7 +48,7 @@ class BaseTab(ttk.Frame, ABC):
         # Standard callbacks - implement in subclass or controller
         self.on_clear_clicked = None
 
-        logger.info(f"Initializing {tab_name} tab")
+        logger.info("Initializing %s tab", tab_name)
 
         # Setup tab UI
         self._setup_ui()
@@ -106,7 +108,7 @@ class BaseTab(ttk.Frame, ABC):
         Default implementation posts to logger.
         Override in subclass to show in UI.
         """
-        logger.info(f"[{self.tab_name}] {message}")
+        logger.info("[%s] %s", self.tab_name, message)
 
     def show_error(self, message: str):
         """
@@ -114,7 +116,7 @@ class BaseTab(ttk.Frame, ABC):
         Default implementation posts to logger.
         Override in subclass to show as messagebox.
         """
-        logger.error(f"[{self.tab_name}] Error: {message}")
+        logger.error("[%s] Error: %s", self.tab_name, message)
 
     def show_success(self, message: str):
         """
@@ -122,7 +124,7 @@ class BaseTab(ttk.Frame, ABC):
         Default implementation posts to logger.
         Override in subclass to show as messagebox.
         """
-        logger.info(f"[{self.tab_name}] Success: {message}")
+        logger.info("[%s] Success: %s", self.tab_name, message)
 
     def show_loading(self, show: bool = True):
         """
@@ -142,6 +144,20 @@ class BaseTab(ttk.Frame, ABC):
             self.clear_all()
             self.set_status("Cleared")
 
+    def _trim_log(self, widget: tk.Text):
+        """
+        Drop the oldest lines of a log widget beyond MAX_LOG_LINES.
+
+        Keeps long sessions from growing the widget (and the cost of its
+        inserts and scrolls) without bound.
+
+        Args:
+            widget: Log Text widget, in NORMAL state
+        """
+        lines = int(widget.index("end-1c").split(".")[0])
+        if lines > self.MAX_LOG_LINES:
+            widget.delete("1.0", f"{lines - self.MAX_LOG_LINES + 1}.0")
+
     def get_main_window(self):
         """
         Get the main window instance to access other tabs.
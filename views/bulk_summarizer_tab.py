@@ -459,6 +459,7 @@ class BulkSummarizerTab(BaseTab):
         indicators = {"success": "\u2713", "error": "\u2717", "info": "\u2022", "warning": "\u26a0"}
         indicator = indicators.get(status, "\u2022")
         self.status_log.insert(tk.END, f"[{timestamp}] {indicator} {message}\n")
+        self._trim_log(self.status_log)
         self.status_log.see(tk.END)
         self.status_log.config(state=tk.DISABLED)
 
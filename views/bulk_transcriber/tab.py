@@ -193,7 +193,10 @@ class BulkTranscriberTab(BaseTab):
     
     def _on_start_clicked(self):
         """Called when Start button clicked"""
-        logger.debug(f"Bulk Transcriber Start button clicked. Callback registered: {self.on_start_requested is not None}")
+        logger.debug(
+            "Bulk Transcriber Start button clicked. Callback registered: %s",
+            self.on_start_requested is not None,
+        )
         if self.on_start_requested:
             self.on_start_requested()
         else:
@@ -290,7 +293,7 @@ class BulkTranscriberTab(BaseTab):
     def set_on_start_requested(self, callback):
         """Register callback for start button"""
         self.on_start_requested = callback
-        logger.info(f"Bulk Transcriber start callback registered: {callback}")
+        logger.info("Bulk Transcriber start callback registered: %s", callback)
     
     def set_on_cancel_requested(self, callback):
         """Register callback for cancel button"""
@@ -502,6 +502,7 @@ class BulkTranscriberTab(BaseTab):
         indicators = {"success": "\u2713", "error": "\u2717", "info": "\u2022", "warning": "\u26a0"}
         indicator = indicators.get(status, "\u2022")
         self.status_log.insert(tk.END, f"[{timestamp}] {indicator} {message}\n")
+        self._trim_log(self.status_log)
         self.status_log.see(tk.END)
         self.status_log.config(state=tk.DISABLED)
 
@@ -541,7 +542,7 @@ class BulkTranscriberTab(BaseTab):
 
     def set_on_start_requested(self, callback):
         self.on_start_requested = callback
-        logger.info(f"Bulk Transcriber start callback registered: {callback}")
+        logger.info("Bulk Transcriber start callback registered: %s", callback)
 
     def set_on_cancel_requested(self, callback):
         self.on_cancel_requested = callback
@@ -16,7 +16,9 @@ Created: 2026-02-15
 Version: 6.6.0 - Exposed audio-only options in resolution dropdown
 """
 
+import threading
 import tkinter as tk
+from collections import deque
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 
@@ -27,9 +29,16 @@ from controllers.downloader_controller import DownloaderController
 class DownloaderTab(BaseTab):
     """YouTube video downloader tab with full UI and controller integration."""
 
+    LOG_FLUSH_MS = 50  # Batch log lines into one insert per interval
+
     def __init__(self, notebook):
         self.notebook = notebook
         
+        # Log lines waiting for the next batched write; only touched on the
+        # Tk thread (log_message hands calls from download threads over)
+        self._log_queue = deque()
+        self._log_flush_id = None
+        
         # State variables
         self.url_var = tk.StringVar()
         self.download_path_var = tk.StringVar(value="[No folder selected]")
@@ -426,14 +435,36 @@ class DownloaderTab(BaseTab):
     def log_message(self, message: str):
         """Add message to status log.
         
+        Messages are batched and written at most once per LOG_FLUSH_MS, so a
+        burst of log lines costs one insert and one scroll.
+        
         Args:
             message: Log message to display
         """
-        self.status_log.insert(tk.END, message + "\n")
+        if threading.current_thread() is not threading.main_thread():
+            # yt-dlp progress hooks run on the download thread; queue and
+            # flush timer belong to the Tk thread
+            self.after(0, self.log_message, message)
+            return
+        self._log_queue.append(message)
+        if self._log_flush_id is None:
+            self._log_flush_id = self.after(self.LOG_FLUSH_MS, self._flush_log)
+    
+    def _flush_log(self):
+        """Write all queued log messages in a single insert."""
+        self._log_flush_id = None
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+        if not lines:
+            return
+        self.status_log.insert(tk.END, "\n".join(lines) + "\n")
+        self._trim_log(self.status_log)
         self.status_log.see(tk.END)  # Auto-scroll to bottom
         
     def clear_log(self):
-        """Clear the status log."""
+        """Clear the status log, including lines not yet written."""
+        self._log_queue.clear()
         self.status_log.delete("1.0", tk.END)
         
     def set_download_button_state(self, enabled: bool):
@@ -486,6 +517,6 @@ class DownloaderTab(BaseTab):
         self.info_text.config(state=tk.NORMAL)
         self.info_text.delete("1.0", tk.END)
         self.info_text.config(state=tk.DISABLED)
-        self.status_log.delete("1.0", tk.END)
+        self.clear_log()
         self.progress_var.set("Ready")
         # Don't clear download path and PO token - user likely wants to reuse them
@@ -16,15 +16,53 @@ Use:
 
 import os
 import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext, ttk
-from config import N8N_WEBHOOK_URL
+import tkinter.font as tkfont
+from tkinter import filedialog, scrolledtext, ttk
+from config import N8N_WEBHOOK_URL, SUPPORTED_EXTENSIONS
 from utils.logger import logger
 from views.base_tab import BaseTab
+from views.incremental_text import IncrementalText
+from views.text_metrics import TextMetrics
+from views.toast import Toast
+
+# Browse dialog filters; "All Supported" follows config.SUPPORTED_EXTENSIONS
+_FILETYPES = (
+    ("All Supported", " ".join(f"*{ext}" for ext in SUPPORTED_EXTENSIONS)),
+    ("Text Files", "*.txt"),
+    ("Log Files", "*.log"),
+    ("CSV Files", "*.csv"),
+    ("JSON Files", "*.json"),
+    ("XML Files", "*.xml"),
+    ("Subtitles", "*.srt"),
+    ("Word Documents", "*.docx"),
+    ("All Files", "*.*"),
+)
+
+# Loading spinner animation frames
+_SPINNER_FRAMES = "|/-\\"
+
+# File info display, filled from FileModel.get_file_info()
+_INFO_TEMPLATE = (
+    "File: {name} | Size: {size_kb:.2f} KB | Lines: {lines} | "
+    "Characters: {characters} | Characters (no spaces): {characters_no_spaces}\n"
+    "Path: {path}"
+)
+_INFO_DEFAULTS = {
+    "name": "N/A",
+    "size_kb": 0,
+    "lines": 0,
+    "characters": 0,
+    "characters_no_spaces": 0,
+    "path": "N/A",
+}
 
 
 class FileTab(BaseTab):
     """File Summarizer tab - upload file and send to n8n for summarization"""
 
+    LONG_LINE_CHARS = 2000  # Longer lines switch the widget to wrap=CHAR
+    SPINNER_INTERVAL_MS = 200  # Loading spinner frame rate (5 Hz)
+
     def __init__(self, parent):
         """
         Initialize File tab.
@@ -34,7 +72,6 @@ class FileTab(BaseTab):
         """
         # Webhook override state
         self.webhook_override_var = tk.BooleanVar(value=False)
-        self.custom_webhook_var = tk.StringVar(value=N8N_WEBHOOK_URL or "")
 
         # Export preferences
         self.use_original_location_var = tk.BooleanVar(value=False)
@@ -47,6 +84,22 @@ class FileTab(BaseTab):
 
         # UI state for loading indicator
         self._loading = False
+        self._spinner_id = None
+        self._spinner_index = 0
+        self.spinner_label = None  # Created on first show_loading(True)
+
+        # Full path of the loaded file (the label may show it shortened)
+        self._file_path = None
+        self._path_metrics = None
+
+        # In-window notifications (created on first message)
+        self._toast = None
+
+        # Word wrap for preview and response (off = no wrapping, h-scrollbar)
+        self.word_wrap_var = tk.BooleanVar(value=True)
+
+        # Last info dict shown, to skip redundant redraws
+        self._last_info = None
 
         super().__init__(parent, "File Summarizer")
 
@@ -88,6 +141,10 @@ class FileTab(BaseTab):
         self.path_label = ttk.Label(file_frame, textvariable=self.file_path_var)
         self.path_label.grid(row=0, column=0, sticky=tk.W, pady=(0, 8))
 
+        # Re-fit the path label whenever the section is resized
+        file_frame.bind("<Configure>", lambda e: self._update_path_label(), add="+")
+        self._path_frame = file_frame
+
         button_frame = ttk.Frame(file_frame)
         button_frame.grid(row=1, column=0, sticky=(tk.W, tk.E))
 
@@ -113,9 +170,9 @@ class FileTab(BaseTab):
             row=1, column=0, sticky=tk.W, pady=(0, 5)
         )
 
-        self.webhook_entry = ttk.Entry(
-            webhook_frame, textvariable=self.custom_webhook_var
-        )
+        # Only read when sending, so the entry holds the value itself
+        self.webhook_entry = ttk.Entry(webhook_frame)
+        self.webhook_entry.insert(0, N8N_WEBHOOK_URL or "")
         self.webhook_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=(0, 5))
 
     def _setup_file_info_section(self):
@@ -124,13 +181,19 @@ class FileTab(BaseTab):
         info_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
         info_frame.columnconfigure(0, weight=1)
 
-        self.info_text = tk.Text(info_frame, height=4, state=tk.DISABLED, wrap=tk.WORD)
-        self.info_text.grid(row=0, column=0, sticky=(tk.W, tk.E))
-        info_scrollbar = ttk.Scrollbar(
-            info_frame, orient=tk.VERTICAL, command=self.info_text.yview
+        # Plain label: the info is two short lines and never edited
+        self.info_var = tk.StringVar(value="")
+        self.info_label = ttk.Label(
+            info_frame, textvariable=self.info_var, justify=tk.LEFT
+        )
+        self.info_label.grid(row=0, column=0, sticky=(tk.W, tk.E))
+
+        # Wrap long paths to the available width
+        info_frame.bind(
+            "<Configure>",
+            lambda e: self.info_label.configure(wraplength=max(e.width - 30, 100)),
+            add="+",
         )
-        info_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.info_text.config(yscrollcommand=info_scrollbar.set)
 
     def _setup_content_response_section(self):
         """Setup content preview and response display"""
@@ -138,8 +201,8 @@ class FileTab(BaseTab):
         content_response_frame.grid(
             row=3, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10)
         )
-        content_response_frame.columnconfigure(0, weight=1)
-        content_response_frame.columnconfigure(1, weight=1)
+        # Grid takes a list of indices, so both columns share one call
+        content_response_frame.columnconfigure((0, 1), weight=1)
         content_response_frame.rowconfigure(0, weight=1)
 
         # Content Preview (Left)
@@ -152,10 +215,29 @@ class FileTab(BaseTab):
         content_frame.columnconfigure(0, weight=1)
         content_frame.rowconfigure(0, weight=1)
 
+        # One font object for preview and response: resizing it reflows both
+        self.text_font = tkfont.Font(family="Courier", size=10)
+
         self.content_text = scrolledtext.ScrolledText(
-            content_frame, height=20, width=65, wrap=tk.WORD, font=("Courier", 10)
+            content_frame, height=20, width=65, wrap=tk.WORD, font=self.text_font
         )
         self.content_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.content_xscroll = ttk.Scrollbar(
+            content_frame, orient=tk.HORIZONTAL, command=self.content_text.xview
+        )
+        self.content_text.configure(xscrollcommand=self.content_xscroll.set)
+
+        ttk.Checkbutton(
+            content_frame,
+            text="Word wrap",
+            variable=self.word_wrap_var,
+            command=self._apply_wrap,
+        ).grid(row=2, column=0, sticky=tk.W, pady=(5, 0))
+
+        # Large files are materialized in chunks as the user scrolls
+        self._content_loader = IncrementalText(
+            self.content_text, scrollbar=self.content_text.vbar
+        )
 
         # Response Section (Right)
         response_frame = ttk.LabelFrame(
@@ -172,10 +254,19 @@ class FileTab(BaseTab):
             height=20,
             width=65,
             wrap=tk.WORD,
-            font=("Courier", 10),
+            font=self.text_font,
             state=tk.DISABLED,
         )
         self.response_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.response_xscroll = ttk.Scrollbar(
+            response_frame, orient=tk.HORIZONTAL, command=self.response_text.xview
+        )
+        self.response_text.configure(xscrollcommand=self.response_xscroll.set)
+
+        # Long responses are also materialized in chunks as the user scrolls
+        self._response_loader = IncrementalText(
+            self.response_text, scrollbar=self.response_text.vbar
+        )
 
     def _setup_action_bar(self):
         """Setup bottom action bar with buttons and controls"""
@@ -236,40 +327,27 @@ class FileTab(BaseTab):
         )
         self.clear_btn.grid(row=0, column=2, sticky=tk.E, padx=(20, 0))
 
-        # Loading indicator
-        self.progress = ttk.Progressbar(bottom_frame, mode="indeterminate")
+        # Parent for the loading spinner, which is built on first use
+        self._bottom_frame = bottom_frame
 
     # Button callbacks
 
     def _browse_file(self):
         """Handle browse file button"""
-        filetypes = [
-            ("All Supported", "*.txt *.log *.csv *.json *.xml *.srt *.docx"),
-            ("Text Files", "*.txt"),
-            ("Log Files", "*.log"),
-            ("CSV Files", "*.csv"),
-            ("JSON Files", "*.json"),
-            ("XML Files", "*.xml"),
-            ("Subtitles", "*.srt"),
-            ("Word Documents", "*.docx"),
-            ("All Files", "*.*"),
-        ]
         file_path = filedialog.askopenfilename(
-            title="Select a file", filetypes=filetypes
+            title="Select a file", filetypes=_FILETYPES
         )
         if file_path:
-            self.current_file_directory = os.path.dirname(file_path)
-            filename = os.path.basename(file_path)
-            self.current_file_basename = os.path.splitext(filename)[0]
+            self._store_file_parts(file_path)
 
-            logger.info(f"File selected: {file_path}")
+            logger.info("File selected: %s", file_path)
             if self.on_file_selected:
                 self.on_file_selected(file_path)
 
-    def _send_clicked(self):
-        """Handle send button"""
+    def _send_clicked(self, allow_textbox_only: bool = False):
+        """Handle send button (or Summarize Textbox when allow_textbox_only)"""
         if self.on_send_clicked:
-            self.on_send_clicked()
+            self.on_send_clicked(allow_textbox_only)
 
     def _export_txt_clicked(self):
         """Handle export .txt button"""
@@ -284,35 +362,75 @@ class FileTab(BaseTab):
     # Standard tab methods
 
     def get_content(self) -> str:
-        """Get file content"""
-        return self.content_text.get("1.0", tk.END).rstrip()
+        """Get file content (including lines not yet loaded into the widget)"""
+        return self._content_loader.get().rstrip()
+
+    def set_text_size(self, size: int, family: str = None):
+        """
+        Change the font of the preview and response displays together.
+
+        Args:
+            size: Font size in points
+            family: Optional new font family
+        """
+        if family:
+            self.text_font.configure(family=family, size=size)
+        else:
+            self.text_font.configure(size=size)
 
     def get_response_content(self) -> str:
-        """Get response content"""
-        return self.response_text.get("1.0", tk.END).rstrip()
+        """Get response content (including lines not yet loaded into the widget)"""
+        return self._response_loader.get().rstrip()
 
     def get_file_path(self) -> str:
         """Get current file path"""
-        text = self.file_path_var.get()
-        if text.startswith("[FILE] "):
-            return text[7:]  # Remove "[FILE] " prefix
-        return None
+        return self._file_path
 
     def set_content(self, content: str):
         """Set file content"""
-        self.content_text.config(state=tk.NORMAL)
-        self.content_text.delete("1.0", tk.END)
-        if content:
-            self.content_text.insert("1.0", content)
-        self.content_text.config(state=tk.NORMAL)
+        # content_text is always editable, so no state toggling is needed
+        self._content_loader.set(content)
+        self._apply_wrap()
 
     def set_response(self, response: str):
         """Set response content"""
         self.response_text.config(state=tk.NORMAL)
-        self.response_text.delete("1.0", tk.END)
-        if response:
-            self.response_text.insert("1.0", response)
+        self._response_loader.set(response)
         self.response_text.config(state=tk.DISABLED)
+        self._apply_wrap()
+
+    def _wrap_mode(self, longest_line: int) -> str:
+        """
+        Pick the wrap mode for text whose longest line has the given length.
+
+        Word wrapping has to search for break points, which is slow for
+        huge unbroken lines (minified JSON, base64, single-line logs), so
+        those are wrapped at character boundaries instead.
+
+        Args:
+            longest_line: Length of the longest line in characters
+
+        Returns:
+            tk.WORD or tk.CHAR, or tk.NONE if word wrap is switched off
+        """
+        if not self.word_wrap_var.get():
+            return tk.NONE
+        return tk.CHAR if longest_line > self.LONG_LINE_CHARS else tk.WORD
+
+    def _apply_wrap(self):
+        """Update wrap mode and horizontal scrollbars of preview and response"""
+        for widget, loader, xscroll in (
+            (self.content_text, self._content_loader, self.content_xscroll),
+            (self.response_text, self._response_loader, self.response_xscroll),
+        ):
+            wrap = self._wrap_mode(loader.longest_line)
+            if str(widget.cget("wrap")) == wrap:
+                continue
+            widget.configure(wrap=wrap)
+            if wrap == tk.NONE:
+                xscroll.grid(row=1, column=0, sticky=(tk.W, tk.E))
+            else:
+                xscroll.grid_remove()
 
     def display_response(self, response: str):
         """Display response"""
@@ -320,37 +438,57 @@ class FileTab(BaseTab):
 
     def set_file_path(self, file_path: str):
         """Set file path display"""
-        if file_path:
-            self.file_path_var.set(f"[FILE] {file_path}")
-            self.current_file_directory = os.path.dirname(file_path)
-            filename = os.path.basename(file_path)
-            self.current_file_basename = os.path.splitext(filename)[0]
-        else:
-            self.file_path_var.set("No file selected")
+        self._file_path = file_path or None
+        self._update_path_label()
+        self._store_file_parts(file_path)
+
+    def _store_file_parts(self, file_path: str):
+        """
+        Remember directory and base name of a file for smart export naming.
+
+        Args:
+            file_path: Selected file path, or None to clear
+        """
+        if not file_path:
             self.current_file_directory = None
             self.current_file_basename = None
+            return
+
+        directory, filename = os.path.split(file_path)
+        self.current_file_directory = directory
+        self.current_file_basename = os.path.splitext(filename)[0]
+
+    def _update_path_label(self):
+        """Show the file path, shortened in the middle if it doesn't fit"""
+        if not self._file_path:
+            self.file_path_var.set("No file selected")
+            return
+
+        text = f"[FILE] {self._file_path}"
+        available = self._path_frame.winfo_width() - 20  # LabelFrame padding
+        if available > 1:
+            if self._path_metrics is None:
+                font = ttk.Style().lookup("TLabel", "font") or "TkDefaultFont"
+                self._path_metrics = TextMetrics(font)
+            text = self._path_metrics.elide_middle(text, available)
+        self.file_path_var.set(text)
 
     def set_file_info(self, info_dict: dict):
         """Set file info display"""
-        self.info_text.config(state=tk.NORMAL)
-        self.info_text.delete("1.0", tk.END)
+        if info_dict == self._last_info:
+            return
+        self._last_info = dict(info_dict) if info_dict else None
+
+        info_text = ""
         if info_dict:
-            info_text = f"File: {info_dict.get('name', 'N/A')} | "
-            info_text += f"Size: {info_dict.get('size_kb', 0):.2f} KB | "
-            info_text += f"Lines: {info_dict.get('lines', 0)} | "
-            info_text += f"Characters: {info_dict.get('characters', 0)} | "
-            info_text += (
-                f"Characters (no spaces): {info_dict.get('characters_no_spaces', 0)}\n"
-            )
-            info_text += f"Path: {info_dict.get('path', 'N/A')}"
-            self.info_text.insert("1.0", info_text)
-        self.info_text.config(state=tk.DISABLED)
+            info_text = _INFO_TEMPLATE.format_map({**_INFO_DEFAULTS, **info_dict})
+        self.info_var.set(info_text)
 
     def get_webhook_override(self) -> dict:
         """Get webhook override state"""
         return {
             "override": self.webhook_override_var.get(),
-            "custom_url": self.custom_webhook_var.get().strip(),
+            "custom_url": self.webhook_entry.get().strip(),
         }
 
     def get_export_preferences(self) -> dict:
@@ -374,26 +512,45 @@ class FileTab(BaseTab):
     def show_success(self, message: str):
         """Show success message"""
         self.set_status(f"✓ {message}")
-        messagebox.showinfo("Success", message)
+        self._show_toast(message, "success")
 
     def show_error(self, message: str):
         """Show error message"""
         self.set_status(f"✗ {message}")
-        messagebox.showerror("Error", message)
+        self._show_toast(message, "error")
+
+    def _show_toast(self, message: str, kind: str):
+        """Show a non-modal notification over the window"""
+        if self._toast is None:
+            self._toast = Toast(self.root or self.winfo_toplevel())
+        self._toast.show(message, kind)
 
     def show_loading(self, show: bool = True):
         """Show/hide loading indicator"""
         if show and not self._loading:
             self._loading = True
-            self.progress.grid(row=0, column=2, sticky=(tk.W, tk.E), padx=(20, 0))
-            self.progress.start()
+            if self.spinner_label is None:
+                # A text spinner redraws far less than an indeterminate
+                # Progressbar
+                self.spinner_label = ttk.Label(self._bottom_frame, width=14)
+            self.spinner_label.grid(row=0, column=3, sticky=tk.W, padx=(20, 0))
+            self._tick_spinner()
             self.send_btn.config(state=tk.DISABLED)
         elif not show and self._loading:
             self._loading = False
-            self.progress.stop()
-            self.progress.grid_remove()
+            if self._spinner_id is not None:
+                self.after_cancel(self._spinner_id)
+                self._spinner_id = None
+            self.spinner_label.grid_remove()
             self.send_btn.config(state=tk.NORMAL)
 
+    def _tick_spinner(self):
+        """Advance the loading spinner by one frame"""
+        frame = _SPINNER_FRAMES[self._spinner_index % len(_SPINNER_FRAMES)]
+        self.spinner_label.configure(text=f"{frame} Working...")
+        self._spinner_index += 1
+        self._spinner_id = self.after(self.SPINNER_INTERVAL_MS, self._tick_spinner)
+
     def set_status(self, message: str):
         """Set status message"""
-        logger.info(f"[FileTab] {message}")
+        logger.info("[FileTab] %s", message)
@@ -0,0 +1,197 @@
+"""
+Incremental Text Loader
+
+Keeps large documents responsive in a tk.Text widget by materializing only
+the first part of the content up front and appending the remainder in chunks
+as the user scrolls towards the end of what is already loaded.
+
+Tk builds line metadata for everything inserted into a Text widget, so loading
+a multi-MB log in one insert freezes the UI. With this loader the initial cost
+is bounded by the chunk size instead of the document size.
+
+Unloaded text is stored as a queue of immutable pieces (pre-joined runs of
+lines), so materializing a chunk is a pop rather than a re-slice of the whole
+remaining document.
+
+get() returns a cached copy of the document until Tk's modified flag (the
+one behind <<Modified>>) reports a user edit, so repeated reads of an
+unchanged document don't copy it out of the widget again.
+"""
+
+import tkinter as tk
+from collections import deque
+
+from views.text_patch import patch_text
+
+
+class IncrementalText:
+    """
+    Progressive loader for large content in a tk.Text widget.
+
+    Only the first `chunk_lines` lines are inserted up front; the remaining
+    lines are kept in Python and appended whenever the visible region nears
+    the end of the loaded text. Edits made in the widget are preserved because
+    unloaded lines are never touched until they are appended.
+
+    Usage:
+        loader = IncrementalText(text_widget, scrollbar=text_widget.vbar)
+        loader.set(content)
+        full_text = loader.get()
+    """
+
+    CHUNK_LINES = 2000
+    PIECE_LINES = 250  # Lines per stored piece of unloaded text
+    LOAD_THRESHOLD = 0.9  # Load more once the view passes 90% of loaded text
+
+    def __init__(self, widget: tk.Text, scrollbar=None, chunk_lines: int = CHUNK_LINES):
+        """
+        Attach loader to a Text widget.
+
+        Args:
+            widget: The tk.Text widget to fill
+            scrollbar: Scrollbar driven by the widget (e.g. ScrolledText.vbar)
+            chunk_lines: Number of lines materialized per chunk
+        """
+        self.widget = widget
+        self.scrollbar = scrollbar
+        self.chunk_lines = chunk_lines
+
+        # Unloaded text as (piece_text, line_count) runs, oldest first
+        self._pending = deque()
+        self._load_scheduled = False
+        self.longest_line = 0  # Length of the longest line in the last set()
+
+        # Full document text as of the last set()/get(); valid while the
+        # widget's modified flag is clear
+        self._cache = ""
+
+        # Watch scroll position so we know when to materialize more lines
+        self.widget.configure(yscrollcommand=self._on_yscroll)
+
+    def set(self, content: str):
+        """
+        Replace widget content, inserting only the first chunk.
+
+        Args:
+            content: Full text to display
+        """
+        content = content or ""
+        if not self._is_modified():
+            if content == self._cache:
+                return  # Same document, nothing to redraw
+            if (
+                not self._pending
+                and self._cache
+                and content.count("\n") < self.chunk_lines
+            ):
+                # Old and new documents both fit in one chunk: edit only the
+                # changed range instead of rebuilding the widget
+                patch_text(self.widget, self._cache, content)
+                self._cache = content
+                self.longest_line = max(map(len, content.split("\n")))
+                self._mark_clean()
+                return
+
+        self.widget.delete("1.0", tk.END)
+        self._pending.clear()
+        self.longest_line = 0
+        self._cache = content
+        if not content:
+            self._mark_clean()
+            return
+
+        lines = content.split("\n")
+        self.longest_line = max(map(len, lines))
+        if len(lines) > self.chunk_lines:
+            self._store_pending(lines, self.chunk_lines)
+            lines = lines[: self.chunk_lines]
+
+        self.widget.insert("1.0", "\n".join(lines))
+        self._mark_clean()
+
+    def _store_pending(self, lines: list, start: int):
+        """
+        Split lines[start:] into pieces and queue them for later loading.
+
+        Args:
+            lines: All document lines
+            start: Index of the first unloaded line
+        """
+        step = self.PIECE_LINES
+        for i in range(start, len(lines), step):
+            piece_lines = lines[i : i + step]
+            piece = "\n".join(piece_lines)
+            self._pending.append((piece, len(piece_lines)))
+
+    def get(self) -> str:
+        """
+        Get full content: edited widget text plus any unloaded lines.
+
+        Returns:
+            Complete document text
+        """
+        if not self._is_modified():
+            return self._cache
+
+        text = self.widget.get("1.0", "end-1c")
+        if self._pending:
+            text = "\n".join([text, *(piece for piece, _ in self._pending)])
+        self._cache = text
+        self._mark_clean()
+        return text
+
+    def _is_modified(self) -> bool:
+        """True if the widget was edited since the cache was last filled."""
+        return self.widget.tk.getboolean(self.widget.edit_modified())
+
+    def _mark_clean(self):
+        """Clear Tk's modified flag after a programmatic change."""
+        self.widget.edit_modified(False)
+
+    def load_more(self):
+        """Append the next chunk of pending lines to the widget."""
+        self._load_scheduled = False
+        if not self._pending:
+            return
+
+        pieces = []
+        loaded_lines = 0
+        while self._pending and loaded_lines < self.chunk_lines:
+            piece, line_count = self._pending.popleft()
+            pieces.append(piece)
+            loaded_lines += line_count
+
+        # Loading doesn't change the document, so keep the cache valid
+        # unless the user had already edited it
+        was_modified = self._is_modified()
+        self._insert_end("\n" + "\n".join(pieces))
+        if not was_modified:
+            self._mark_clean()
+
+    def _insert_end(self, text: str):
+        """Insert at the end, even if the widget is read-only (DISABLED)."""
+        if str(self.widget.cget("state")) == tk.DISABLED:
+            self.widget.configure(state=tk.NORMAL)
+            self.widget.insert(tk.END, text)
+            self.widget.configure(state=tk.DISABLED)
+        else:
+            self.widget.insert(tk.END, text)
+
+    def _on_yscroll(self, first, last):
+        """
+        Forward scroll updates to the scrollbar and load more when near the end.
+
+        Args:
+            first: Top fraction of the visible region
+            last: Bottom fraction of the visible region
+        """
+        if self.scrollbar is not None:
+            self.scrollbar.set(first, last)
+
+        if (
+            self._pending
+            and not self._load_scheduled
+            and float(last) >= self.LOAD_THRESHOLD
+        ):
+            self._load_scheduled = True
+            self.widget.after_idle(self.load_more)
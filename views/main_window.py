@@ -33,9 +33,9 @@ Version: 6.3
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk
-from pathlib import Path
-from dotenv import load_dotenv
+from dotenv import set_key
 import os
 
 from config import (
@@ -45,20 +45,11 @@ from config import (
     DEFAULT_THEME,
     DARK_THEME,
     LIGHT_THEME,
+    Theme,
 )
 from utils.logger import logger
 from utils.settings_manager import SettingsManager
 from views.file_tab import FileTab
-from views.youtube_summarizer_tab import YouTubeSummarizerTab
-from views.transcriber_tab import TranscriberTab
-from views.bulk_summarizer_tab import BulkSummarizerTab
-from views.bulk_transcriber_tab import BulkTranscriberTab
-from views.translation_tab import TranslationTab
-from views.downloader_tab import DownloaderTab
-from views.video_subtitler_tab import VideoSubtitlerTab
-
-# Load environment variables
-load_dotenv()
 
 
 class MainWindow:
@@ -84,12 +75,52 @@ class MainWindow:
     7. Downloader (index 6)
     """
 
-    # Font sizes
-    FONT_SIZES = [8, 10, 12, 14, 16, 18, 20]
+    # Fonts
+    FONT_FAMILY = "Segoe UI"
+    TITLE_FONT = (FONT_FAMILY, 14, "bold")
+    FONT_SIZES = (8, 10, 12, 14, 16, 18, 20)
+    _FONT_SIZE_INDEX = {size: i for i, size in enumerate(FONT_SIZES)}
     DEFAULT_FONT_SIZE = 10
     ENV_KEY_FONT_SIZE = "APP_FONT_SIZE"
     ENV_FILE = ".env"
 
+    # Font size clicks closer together than this are saved to .env once
+    FONT_SAVE_DELAY_MS = 500
+
+    # Theme button label per current theme (offers the other theme)
+    _THEME_BTN_TEXT = {"light": "🌙 Dark Mode", "dark": "☀️ Light Mode"}
+
+    # Status bar updates closer together than this are merged into one redraw
+    STATUS_DEBOUNCE_MS = 50
+
+    # Lazily built tabs in notebook order (after the File tab):
+    # (MainWindow attribute, tab label, factory method name)
+    _LAZY_TAB_SPECS = (
+        (
+            "youtube_summarizer_tab",
+            "🎜 YouTube Summarization",
+            "_create_youtube_summarizer_tab",
+        ),
+        ("transcriber_tab", "🗡 Transcriber", "_create_transcriber_tab"),
+        ("bulk_summarizer_tab", "📦 Bulk Summarizer", "_create_bulk_summarizer_tab"),
+        ("bulk_transcriber_tab", "🎬 Bulk Transcriber", "_create_bulk_transcriber_tab"),
+        ("translation_tab", "🌐 Translation", "_create_translation_tab"),
+        ("downloader_tab", "📥 Downloader", "_create_downloader_tab"),
+        ("video_subtitler_tab", "🎞 Video Subtitler", "_create_video_subtitler_tab"),
+    )
+
+    # Text widgets restyled on theme / font size changes, per tab attribute
+    _TAB_TEXT_WIDGETS = {
+        "file_tab": ("content_text", "response_text"),
+        "youtube_summarizer_tab": ("summary_text",),
+        "transcriber_tab": ("transcript_text",),
+        "bulk_summarizer_tab": ("status_log",),
+        "bulk_transcriber_tab": ("status_log",),
+        "translation_tab": ("source_text", "target_text"),
+        "downloader_tab": ("status_log",),
+        "video_subtitler_tab": ("srt_text", "translated_srt_text"),
+    }
+
     def __init__(self, root, settings_manager: SettingsManager):
         """
         Initialize main window.
@@ -106,24 +137,63 @@ class MainWindow:
         # Store settings manager
         self.settings = settings_manager
 
+        # Pending font size / theme applies (see _schedule_font_size_apply
+        # and _toggle_theme)
+        self._font_apply_id = None
+        self._theme_apply_id = None
+        self._font_save_id = None  # Delayed .env write of the font size
+        self._applied_font_size = None  # Size the widgets currently use
+
+        # Debounced status bar state
+        self._status_pending = "Ready"
+        self._status_timer = None
+
         # Theme state - load from .env or use default
-        self.current_theme = self._load_theme_from_env()
+        # (anything other than "light" means dark, as before)
+        theme = self._load_theme_from_env()
+        self.current_theme = "light" if theme == "light" else "dark"
         self.theme_colors = LIGHT_THEME if self.current_theme == "light" else DARK_THEME
 
         # Font size state - load from .env if available
-        self.current_font_size = self._load_font_size_from_env()
+        self._font_size_index = self._FONT_SIZE_INDEX[self._load_font_size_from_env()]
 
         # Theme callback
         self.on_theme_toggle = None
 
+        # Theme whose colors the widgets currently have (see _apply_theme)
+        self._applied_theme = None
+
+        # Shared ttk style database (configured in _apply_theme)
+        self._style = ttk.Style(self.root)
+        # Font object for ttk labels/buttons, so Tk resolves it only once
+        self._ui_font = tkfont.Font(root=self.root, family=self.FONT_FAMILY, size=10)
+
+        # Shared fonts for tab text widgets and the file info label. Font
+        # size changes reconfigure these once instead of every widget.
+        self._text_font = tkfont.Font(
+            root=self.root, family=self.FONT_FAMILY, size=self.current_font_size
+        )
+        self._small_font = tkfont.Font(
+            root=self.root, family=self.FONT_FAMILY, size=self.current_font_size - 1
+        )
+
+        # Text widgets to recolor on theme changes (see _register_tab_widgets)
+        self._themed_text_widgets = []
+
+        # Tabs not built yet: name -> (placeholder frame, factory), plus
+        # callbacks waiting for them (see on_tab_created)
+        self._lazy_tabs = {}
+        self._tab_created_callbacks = {}
+
         # Setup UI
         self._setup_ui()
 
         # IMPORTANT: Apply loaded font size AFTER tabs are created
-        # This ensures all text widgets exist before we try to configure them
-        self._apply_font_size()
-
-        self._apply_theme()
+        # This ensures all text widgets exist before we try to configure them.
+        # Both run from the first idle pass of the main loop, together with
+        # Tk's own geometry work, instead of delaying the window being shown.
+        self.root.after_idle(self._apply_font_size)
+        self.root.after_idle(self._apply_theme)
 
         # Restore last active tab AFTER all tabs are created
         self._restore_last_active_tab()
@@ -131,8 +201,13 @@ class MainWindow:
         # Bind tab change event to save preference
         self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
+        # Don't lose a delayed font size save when the window is closed
+        self.root.bind("<Destroy>", self._on_root_destroy, add="+")
+
         logger.info(
-            f"MainWindow initialized (v6.3 - {self.current_theme} theme, {self.current_font_size}px font)"
+            "MainWindow initialized (v6.3 - %s theme, %spx font)",
+            self.current_theme,
+            self.current_font_size,
         )
 
     def _restore_last_active_tab(self):
@@ -146,12 +221,13 @@ class MainWindow:
             # Validate tab index (0-7 for 8 tabs)
             if 0 <= last_tab <= 7:
                 self.notebook.select(last_tab)
-                logger.info(f"Restored last active tab: {last_tab}")
+                self._ensure_selected_tab_built()
+                logger.info("Restored last active tab: %s", last_tab)
             else:
-                logger.warning(f"Invalid tab index {last_tab}, using default (0)")
+                logger.warning("Invalid tab index %s, using default (0)", last_tab)
                 self.notebook.select(0)
         except Exception as e:
-            logger.error(f"Error restoring last active tab: {str(e)}")
+            logger.error("Error restoring last active tab: %s", e)
             self.notebook.select(0)
 
     def _on_tab_changed(self, event=None):
@@ -161,12 +237,14 @@ class MainWindow:
         Args:
             event: Tkinter event (unused)
         """
+        self._ensure_selected_tab_built()
+
         try:
             current_tab = self.notebook.index(self.notebook.select())
             self.settings.set_last_active_tab(current_tab)
-            logger.debug(f"Saved current tab to settings: {current_tab}")
+            logger.debug("Saved current tab to settings: %s", current_tab)
         except Exception as e:
-            logger.error(f"Error saving current tab: {str(e)}")
+            logger.error("Error saving current tab: %s", e)
 
     def _load_font_size_from_env(self) -> int:
         """
@@ -180,21 +258,19 @@ class MainWindow:
             if env_font_size:
                 font_size = int(env_font_size)
                 # Validate that it's in our FONT_SIZES list
-                if font_size in self.FONT_SIZES:
-                    logger.info(f"Loaded font size from .env: {font_size}px")
+                if font_size in self._FONT_SIZE_INDEX:
+                    logger.info("Loaded font size from .env: %spx", font_size)
                     return font_size
                 else:
                     logger.warning(
-                        f"Font size {font_size} not in allowed sizes, using default"
+                        "Font size %s not in allowed sizes, using default", font_size
                     )
                     return self.DEFAULT_FONT_SIZE
             else:
                 logger.debug("No font size preference found in .env, using default")
                 return self.DEFAULT_FONT_SIZE
         except (ValueError, TypeError) as e:
-            logger.warning(
-                f"Error parsing font size from .env: {str(e)}, using default"
-            )
+            logger.warning("Error parsing font size from .env: %s, using default", e)
             return self.DEFAULT_FONT_SIZE
 
     def _save_font_size_to_env(self, font_size: int) -> bool:
@@ -210,34 +286,20 @@ class MainWindow:
             True if successful, False otherwise
         """
         try:
-            env_path = Path(self.ENV_FILE)
-
-            # Read existing .env content
-            env_content = {}
-            if env_path.exists():
-                with open(env_path, "r") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#"):
-                            if "=" in line:
-                                key, value = line.split("=", 1)
-                                # Skip APP_FONT_SIZE as we'll add updated version
-                                if key.strip() != self.ENV_KEY_FONT_SIZE:
-                                    env_content[key.strip()] = value.strip()
-
-            # Add/update font size
-            env_content[self.ENV_KEY_FONT_SIZE] = str(font_size)
-
-            # Write back to .env
-            with open(env_path, "w") as f:
-                for key, value in env_content.items():
-                    f.write(f"{key}={value}\n")
-
-            logger.info(f"Saved font size preference to .env: {font_size}px")
+            # python-dotenv rewrites only this key's line, keeping comments,
+            # quoting and the other settings intact
+            set_key(
+                self.ENV_FILE,
+                self.ENV_KEY_FONT_SIZE,
+                str(font_size),
+                quote_mode="never",
+            )
+
+            logger.info("Saved font size preference to .env: %spx", font_size)
             return True
 
         except Exception as e:
-            logger.error(f"Error saving font size to .env: {str(e)}")
+            logger.error("Error saving font size to .env: %s", e)
             return False
 
     def _setup_ui(self):
@@ -279,7 +341,7 @@ class MainWindow:
         header_frame.columnconfigure(0, weight=1)
 
         self.title_label = ttk.Label(
-            header_frame, text=f"{APP_TITLE}", font=("Segoe UI", 14, "bold")
+            header_frame, text=f"{APP_TITLE}", font=self.TITLE_FONT
         )
         self.title_label.grid(row=0, column=0, sticky=tk.W)
 
@@ -296,9 +358,11 @@ class MainWindow:
         self.font_decrease_btn.pack(side=tk.LEFT, padx=(0, 2))
 
         # Font size display - Initialize with current font size
-        self.font_size_var = tk.StringVar(value=f"{self.current_font_size}px")
         self.font_size_label = ttk.Label(
-            controls_frame, textvariable=self.font_size_var, width=6, anchor=tk.CENTER
+            controls_frame,
+            text=f"{self.current_font_size}px",
+            width=6,
+            anchor=tk.CENTER,
         )
         self.font_size_label.pack(side=tk.LEFT, padx=2)
 
@@ -311,7 +375,7 @@ class MainWindow:
         # Theme toggle button
         self.theme_btn = ttk.Button(
             controls_frame,
-            text="🌙 Dark Mode" if self.current_theme == "light" else "☀️ Light Mode",
+            text=self._THEME_BTN_TEXT[self.current_theme],
             command=self._toggle_theme,
         )
         self.theme_btn.pack(side=tk.LEFT)
@@ -342,36 +406,165 @@ class MainWindow:
         # Tab 0: File Summarizer
         self.file_tab = FileTab(self.notebook)
         self.notebook.add(self.file_tab, text="📄 File Summarizer")
+        self.file_tab.info_label.configure(font=self._small_font)
+        self._register_tab_widgets("file_tab", self.file_tab)
 
-        # Tab 1: YouTube Summarization
-        self.youtube_summarizer_tab = YouTubeSummarizerTab(self.notebook)
-        self.notebook.add(self.youtube_summarizer_tab, text="🎜 YouTube Summarization")
+        # Tabs 1-7 are built when first selected
+        for name, text, factory in self._LAZY_TAB_SPECS:
+            self._add_lazy_tab(name, text, getattr(self, factory))
 
-        # Tab 2: Transcriber
-        self.transcriber_tab = TranscriberTab(self.notebook, self.settings)
-        self.notebook.add(self.transcriber_tab, text="🗡 Transcriber")
+        # Tab attribute names in notebook order, for get_current_tab()
+        self._tab_names = ["file_tab"] + [spec[0] for spec in self._LAZY_TAB_SPECS]
 
-        # Tab 3: Bulk Summarizer
-        self.bulk_summarizer_tab = BulkSummarizerTab(self.notebook)
-        self.notebook.add(self.bulk_summarizer_tab, text="📦 Bulk Summarizer")
+        logger.info("All tabs initialized (v8.2 - Video Subtitler with Local Files)")
 
-        # Tab 4: Bulk Transcriber
-        self.bulk_transcriber_tab = BulkTranscriberTab(self.notebook)
-        self.notebook.add(self.bulk_transcriber_tab, text="🎬 Bulk Transcriber")
+    def _register_tab_widgets(self, name: str, tab):
+        """
+        Record a tab's text widgets for theme updates and style them.
 
-        # Tab 5: Translation
-        self.translation_tab = TranslationTab(self.notebook)
-        self.notebook.add(self.translation_tab, text="🌐 Translation")
+        Each widget gets the current colors and the shared text font in a
+        single configure() call.
 
-        # Tab 6: Downloader
-        self.downloader_tab = DownloaderTab(self.notebook)
-        self.notebook.add(self.downloader_tab, text="📥 Downloader")
+        Args:
+            name: Tab attribute name (key of _TAB_TEXT_WIDGETS)
+            tab: Tab instance
+        """
+        text_bg = self.theme_colors.bg_secondary
+        text_fg = self.theme_colors.text_primary
+        for attr in self._TAB_TEXT_WIDGETS.get(name, ()):
+            widget = getattr(tab, attr, None)
+            if widget is None:
+                continue
+            self._themed_text_widgets.append(widget)
+            options = {"bg": text_bg, "fg": text_fg, "insertbackground": text_fg}
+            # File tab preview/response follow FileTab.text_font instead
+            if name != "file_tab":
+                options["font"] = self._text_font
+            widget.configure(**options)
 
-        # Tab 7: Video Subtitler
-        self.video_subtitler_tab = VideoSubtitlerTab(self.notebook)
-        self.notebook.add(self.video_subtitler_tab, text="🎞 Video Subtitler")
+    # Lazy tabs
 
-        logger.info("All tabs initialized (v8.2 - Video Subtitler with Local Files)")
+    def _create_youtube_summarizer_tab(self, parent):
+        """Build the YouTube Summarization tab (imported on first use)"""
+        from views.youtube_summarizer_tab import YouTubeSummarizerTab
+
+        return YouTubeSummarizerTab(parent)
+
+    def _create_transcriber_tab(self, parent):
+        """Build the Transcriber tab (imported on first use)"""
+        from views.transcriber_tab import TranscriberTab
+
+        return TranscriberTab(parent, self.settings)
+
+    def _create_bulk_summarizer_tab(self, parent):
+        """Build the Bulk Summarizer tab (imported on first use)"""
+        from views.bulk_summarizer_tab import BulkSummarizerTab
+
+        return BulkSummarizerTab(parent)
+
+    def _create_bulk_transcriber_tab(self, parent):
+        """Build the Bulk Transcriber tab (imported on first use)"""
+        from views.bulk_transcriber_tab import BulkTranscriberTab
+
+        return BulkTranscriberTab(parent)
+
+    def _create_translation_tab(self, parent):
+        """Build the Translation tab (imported on first use)"""
+        from views.translation_tab import TranslationTab
+
+        return TranslationTab(parent)
+
+    def _create_downloader_tab(self, parent):
+        """Build the Downloader tab (imports the downloader backends on first use)"""
+        from views.downloader_tab import DownloaderTab
+
+        return DownloaderTab(parent)
+
+    def _create_video_subtitler_tab(self, parent):
+        """Build the Video Subtitler tab (imported on first use)"""
+        from views.video_subtitler_tab import VideoSubtitlerTab
+
+        return VideoSubtitlerTab(parent)
+
+    def _add_lazy_tab(self, name: str, text: str, factory):
+        """
+        Add a notebook page whose tab is only built when first needed.
+
+        Until then the page holds an empty placeholder frame and the
+        MainWindow attribute `name` does not exist, so hasattr() checks in
+        the theme and font code skip it.
+
+        Args:
+            name: MainWindow attribute the tab is stored under
+            text: Notebook tab label
+            factory: Callable(parent) -> tab widget
+        """
+        placeholder = ttk.Frame(self.notebook)
+        placeholder.columnconfigure(0, weight=1)
+        placeholder.rowconfigure(0, weight=1)
+        ttk.Label(placeholder, text="Loading...").grid(row=0, column=0)
+        self.notebook.add(placeholder, text=text)
+        self._lazy_tabs[name] = (placeholder, factory)
+
+    def _build_lazy_tab(self, name: str):
+        """
+        Build a lazy tab into its placeholder and run its creation callbacks.
+
+        Args:
+            name: MainWindow attribute of the tab
+        """
+        placeholder, factory = self._lazy_tabs.pop(name)
+        for child in placeholder.winfo_children():
+            child.destroy()
+
+        tab = factory(placeholder)
+        tab.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        setattr(self, name, tab)
+        # Gives the new widgets the current colors and font; ttk styles are
+        # global and already configured
+        self._register_tab_widgets(name, tab)
+        logger.info("Lazy tab built: %s", name)
+
+        for callback in self._tab_created_callbacks.pop(name, []):
+            callback(tab)
+
+    def _ensure_selected_tab_built(self):
+        """Build the selected tab if it is still a placeholder"""
+        selected = self.notebook.select()
+        for name, (placeholder, _) in list(self._lazy_tabs.items()):
+            if str(placeholder) == selected:
+                self._build_lazy_tab(name)
+                break
+
+    def get_tab(self, name: str):
+        """
+        Get a tab by attribute name, building it first if it is lazy.
+
+        Args:
+            name: Tab attribute (e.g. 'transcriber_tab')
+
+        Returns:
+            Tab widget or None if there is no such tab
+        """
+        if name in self._lazy_tabs:
+            self._build_lazy_tab(name)
+        return getattr(self, name, None)
+
+    def on_tab_created(self, name: str, callback):
+        """
+        Run callback(tab) once the named tab exists.
+
+        Used to wire controllers to lazy tabs; runs immediately if the tab
+        has already been built.
+
+        Args:
+            name: Tab attribute (e.g. 'transcriber_tab')
+            callback: Callable taking the tab widget
+        """
+        if name in self._lazy_tabs:
+            self._tab_created_callbacks.setdefault(name, []).append(callback)
+        else:
+            callback(getattr(self, name))
 
     def _setup_status_bar(self, parent):
         """
@@ -384,140 +577,109 @@ class MainWindow:
         status_frame.grid(row=2, column=0, sticky=(tk.W, tk.E))
         status_frame.columnconfigure(0, weight=1)
 
-        self.status_var = tk.StringVar(value="Ready")
-        self.status_label = ttk.Label(
-            status_frame, textvariable=self.status_var, relief=tk.SUNKEN
-        )
+        self.status_label = ttk.Label(status_frame, text="Ready", relief=tk.SUNKEN)
         self.status_label.grid(row=0, column=0, sticky=(tk.W, tk.E))
 
     def _apply_theme(self):
         """
         Apply current theme colors to all widgets.
         """
-        style = ttk.Style()
-        style.theme_use("clam")
-
+        style = self._style
         colors = self.theme_colors
 
-        # Configure widget styles
-        style.configure(
-            "TLabel", background=colors["bg_primary"], foreground=colors["text_primary"]
-        )
-        style.configure("TFrame", background=colors["bg_primary"])
-        style.configure(
-            "TLabelFrame", background=colors["bg_primary"], bordercolor=colors["border"]
-        )
-        style.configure(
-            "TLabelFrame.Label",
-            background=colors["bg_primary"],
-            foreground=colors["accent"],
-            font=("Segoe UI", 10),
-        )
-        style.configure(
-            "TButton",
-            font=("Segoe UI", 10),
-            background=colors["button_bg"],
-            foreground=colors["text_primary"],
-        )
-        style.map("TButton", background=[("active", colors["button_hover"])])
-        style.configure(
-            "TCheckbutton",
-            background=colors["bg_primary"],
-            foreground=colors["text_primary"],
-        )
-        style.configure(
-            "TRadiobutton",
-            background=colors["bg_primary"],
-            foreground=colors["text_primary"],
-        )
-        style.configure(
-            "TEntry",
-            fieldbackground=colors["bg_secondary"],
-            foreground=colors["text_primary"],
-        )
-        style.configure("TNotebook", background=colors["bg_primary"])
-        style.configure(
-            "TNotebook.Tab",
-            background=colors["bg_secondary"],
-            foreground=colors["text_primary"],
-        )
-        style.map("TNotebook.Tab", background=[("selected", colors["bg_primary"])])
+        # Each color scheme is a ttk theme derived from clam, created the
+        # first time it is needed; switching is then one theme_use() call
+        # instead of a configure()/map() call per style
+        theme_name = f"app_{self.current_theme}"
+        if theme_name not in style.theme_names():
+            style.theme_create(
+                theme_name, parent="clam", settings=self._theme_settings(colors)
+            )
+        if style.theme_use() != theme_name:
+            style.theme_use(theme_name)
+
+        # Widget colors: skip if this window already shows the theme
+        if self._applied_theme == self.current_theme:
+            return
+        previous_theme = self._applied_theme
+        self._applied_theme = self.current_theme
 
         # Apply to root
-        self.root.configure(bg=colors["bg_primary"])
+        self.root.configure(bg=colors.bg_primary)
 
-        # Update text widget colors in tabs
-        text_bg = colors["bg_secondary"]
-        text_fg = colors["text_primary"]
+        # Update text widget colors in tabs. _register_tab_widgets already
+        # gave each widget the colors (and font) of the theme current when
+        # it was built, so the first apply has nothing to recolor.
+        if previous_theme is not None:
+            self._color_text_widgets(self._themed_text_widgets)
 
-        # File tab
+        # File tab extras: path label (info label follows the TLabel style)
         if hasattr(self, "file_tab"):
-            self.file_tab.content_text.configure(
-                bg=text_bg, fg=text_fg, insertbackground=text_fg
-            )
-            self.file_tab.response_text.configure(
-                bg=text_bg, fg=text_fg, insertbackground=text_fg
-            )
-            self.file_tab.info_text.configure(bg=text_bg, fg=text_fg)
-            self.file_tab.path_label.configure(foreground=colors["text_secondary"])
-
-        # YouTube Summarizer tab
-        if hasattr(self, "youtube_summarizer_tab"):
-            self.youtube_summarizer_tab.summary_text.configure(
-                bg=text_bg, fg=text_fg, insertbackground=text_fg
-            )
+            self.file_tab.path_label.configure(foreground=colors.text_secondary)
 
-        # Transcriber tab
-        if hasattr(self, "transcriber_tab"):
-            self.transcriber_tab.transcript_text.configure(
-                bg=text_bg, fg=text_fg, insertbackground=text_fg
-            )
+        # Title label
+        if hasattr(self, "title_label"):
+            self.title_label.configure(foreground=colors.text_primary)
 
-        # Bulk Summarizer tab
-        if hasattr(self, "bulk_summarizer_tab"):
-            self.bulk_summarizer_tab.status_log.configure(
-                bg=text_bg, fg=text_fg, insertbackground=text_fg
-            )
+        logger.info("Applied %s theme", self.current_theme)
 
-        # Bulk Transcriber tab
-        if hasattr(self, "bulk_transcriber_tab"):
-            self.bulk_transcriber_tab.status_log.configure(
-                bg=text_bg, fg=text_fg, insertbackground=text_fg
-            )
-
-        # Translation tab
-        if hasattr(self, "translation_tab"):
-            self.translation_tab.source_text.configure(
-                bg=text_bg, fg=text_fg, insertbackground=text_fg
-            )
-            self.translation_tab.target_text.configure(
-                bg=text_bg, fg=text_fg, insertbackground=text_fg
-            )
+    def _color_text_widgets(self, widgets):
+        """
+        Apply the current theme colors to text widgets.
 
-        # Downloader tab
-        if hasattr(self, "downloader_tab"):
-            self.downloader_tab.status_log.configure(
-                bg=text_bg, fg=text_fg, insertbackground=text_fg
-            )
+        Args:
+            widgets: Iterable of tk.Text-like widgets
+        """
+        text_bg = self.theme_colors.bg_secondary
+        text_fg = self.theme_colors.text_primary
+        for widget in widgets:
+            widget.configure(bg=text_bg, fg=text_fg, insertbackground=text_fg)
 
-        # Video Subtitler tab
-        if hasattr(self, "video_subtitler_tab"):
-            self.video_subtitler_tab.srt_text.configure(
-                bg=text_bg, fg=text_fg, insertbackground=text_fg
-            )
-            if hasattr(self.video_subtitler_tab, "translated_srt_text"):
-                self.video_subtitler_tab.translated_srt_text.configure(
-                    bg=text_bg, fg=text_fg, insertbackground=text_fg
-                )
-            if hasattr(self.video_subtitler_tab, "ffmpeg_status_var"):
-                # FFmpeg status label uses the same colors as other status labels
-                pass  # The label automatically inherits from theme configuration
+    def _theme_settings(self, colors: Theme) -> dict:
+        """
+        Build ttk.Style.theme_create() settings for a color scheme.
 
-        # Title label
-        if hasattr(self, "title_label"):
-            self.title_label.configure(foreground=colors["text_primary"])
+        Args:
+            colors: Theme colors (LIGHT_THEME or DARK_THEME)
 
-        logger.info(f"Applied {self.current_theme} theme")
+        Returns:
+            Dict of style name -> {"configure": options, "map": state maps}
+        """
+        bg = colors.bg_primary
+        bg_alt = colors.bg_secondary
+        fg = colors.text_primary
+        font = self._ui_font
+
+        return {
+            "TLabel": {"configure": {"background": bg, "foreground": fg}},
+            "TFrame": {"configure": {"background": bg}},
+            "TLabelFrame": {
+                "configure": {"background": bg, "bordercolor": colors.border}
+            },
+            "TLabelFrame.Label": {
+                "configure": {
+                    "background": bg,
+                    "foreground": colors.accent,
+                    "font": font,
+                }
+            },
+            "TButton": {
+                "configure": {
+                    "background": colors.button_bg,
+                    "foreground": fg,
+                    "font": font,
+                },
+                "map": {"background": [("active", colors.button_hover)]},
+            },
+            "TCheckbutton": {"configure": {"background": bg, "foreground": fg}},
+            "TRadiobutton": {"configure": {"background": bg, "foreground": fg}},
+            "TEntry": {"configure": {"fieldbackground": bg_alt, "foreground": fg}},
+            "TNotebook": {"configure": {"background": bg}},
+            "TNotebook.Tab": {
+                "configure": {"background": bg_alt, "foreground": fg},
+                "map": {"background": [("selected", bg)]},
+            },
+        }
 
     def _toggle_theme(self):
         """
@@ -527,27 +689,27 @@ class MainWindow:
         self.theme_colors = DARK_THEME if self.current_theme == "dark" else LIGHT_THEME
 
         # Update button text
-        self.theme_btn.configure(
-            text="🌙 Dark Mode" if self.current_theme == "light" else "☀️ Light Mode"
-        )
+        self.theme_btn.configure(text=self._THEME_BTN_TEXT[self.current_theme])
 
-        # Apply new theme
-        self._apply_theme()
-
-        # Save theme preference to .env
-        self._save_theme_to_env(self.current_theme)
+        # Apply new theme and save it once Tk is idle, so the restyle is
+        # drawn in one pass and rapid toggles only apply the final theme
+        if self._theme_apply_id is None:
+            self._theme_apply_id = self.root.after_idle(self._flush_theme)
 
         # Call callback if set
         if self.on_theme_toggle:
             self.on_theme_toggle(self.current_theme)
 
+    def _flush_theme(self):
+        """Apply the pending theme change and save it to .env"""
+        self._theme_apply_id = None
+        self._apply_theme()
+        self._save_theme_to_env(self.current_theme)
+
     def _save_theme_to_env(self, theme):
         """
         Save theme preference to .env file.
         """
-        import os
-        from dotenv import dotenv_values, set_key
-
         env_path = os.path.join(os.path.dirname(__file__), "..", ".env")
 
         # Use python-dotenv to update .env file
@@ -556,121 +718,96 @@ class MainWindow:
     def _load_theme_from_env(self):
         """
         Load theme preference from .env file or use default.
-        """
-        import os
-        from dotenv import dotenv_values
 
-        env_path = os.path.join(os.path.dirname(__file__), "..", ".env")
-
-        # Load .env values
-        if os.path.exists(env_path):
-            env_values = dotenv_values(env_path)
-            return env_values.get("APP_THEME", DEFAULT_THEME)
+        config.py already loaded .env into the environment at import, so
+        this is a dict lookup rather than a second parse of the file.
+        """
+        return os.getenv("APP_THEME", DEFAULT_THEME)
 
-        return DEFAULT_THEME
+    @property
+    def current_font_size(self) -> int:
+        """Current text font size (an entry of FONT_SIZES)"""
+        return self.FONT_SIZES[self._font_size_index]
 
     def _increase_font_size(self):
         """
         Increase font size of all text widgets and save preference to .env
         """
-        # Find next size
-        current_index = self.FONT_SIZES.index(self.current_font_size)
-        if current_index < len(self.FONT_SIZES) - 1:
-            self.current_font_size = self.FONT_SIZES[current_index + 1]
-            self._apply_font_size()
-            # Save to .env
-            self._save_font_size_to_env(self.current_font_size)
-            logger.info(
-                f"Font size increased to {self.current_font_size}px (saved to .env)"
-            )
+        if self._font_size_index < len(self.FONT_SIZES) - 1:
+            self._font_size_index += 1
+            self._schedule_font_size_apply()
 
     def _decrease_font_size(self):
         """
         Decrease font size of all text widgets and save preference to .env
         """
-        # Find previous size
-        current_index = self.FONT_SIZES.index(self.current_font_size)
-        if current_index > 0:
-            self.current_font_size = self.FONT_SIZES[current_index - 1]
-            self._apply_font_size()
-            # Save to .env
-            self._save_font_size_to_env(self.current_font_size)
-            logger.info(
-                f"Font size decreased to {self.current_font_size}px (saved to .env)"
-            )
+        if self._font_size_index > 0:
+            self._font_size_index -= 1
+            self._schedule_font_size_apply()
 
-    def _apply_font_size(self):
+    def _schedule_font_size_apply(self):
         """
-        Apply current font size to all text widgets.
+        Apply and save the font size once the current burst of clicks ends.
 
-        v6.3: Applies to all tabs including Downloader
+        Rapid clicks only move the font size index; the widgets are updated
+        once, for the final size, when Tk is idle. Saving to .env waits
+        until the clicks have stopped for FONT_SAVE_DELAY_MS.
         """
-        # Update display label
-        self.font_size_var.set(f"{self.current_font_size}px")
+        self.font_size_label.configure(text=f"{self.current_font_size}px")
+        if self._font_apply_id is None:
+            self._font_apply_id = self.root.after_idle(self._flush_font_size)
 
-        # Apply to File tab
-        if hasattr(self, "file_tab"):
-            self.file_tab.content_text.configure(
-                font=("Segoe UI", self.current_font_size)
-            )
-            self.file_tab.response_text.configure(
-                font=("Segoe UI", self.current_font_size)
-            )
-            self.file_tab.info_text.configure(
-                font=("Segoe UI", self.current_font_size - 1)
-            )
+    def _flush_font_size(self):
+        """Apply the pending font size change and schedule saving it"""
+        self._font_apply_id = None
+        if self.current_font_size == self._applied_font_size:
+            return  # Clicks cancelled out (e.g. + then -)
+        self._apply_font_size()
 
-        # Apply to YouTube Summarizer tab
-        if hasattr(self, "youtube_summarizer_tab"):
-            self.youtube_summarizer_tab.summary_text.configure(
-                font=("Segoe UI", self.current_font_size)
-            )
+        # Restart the save timer so a series of clicks is written once
+        if self._font_save_id is not None:
+            self.root.after_cancel(self._font_save_id)
+        self._font_save_id = self.root.after(
+            self.FONT_SAVE_DELAY_MS, self._save_pending_font_size
+        )
 
-        # Apply to Transcriber tab
-        if hasattr(self, "transcriber_tab"):
-            self.transcriber_tab.transcript_text.configure(
-                font=("Segoe UI", self.current_font_size)
-            )
+    def _save_pending_font_size(self):
+        """Write the font size scheduled by _flush_font_size to .env"""
+        self._font_save_id = None
+        self._save_font_size_to_env(self.current_font_size)
 
-        # Apply to Bulk Summarizer tab
-        if hasattr(self, "bulk_summarizer_tab"):
-            self.bulk_summarizer_tab.status_log.configure(
-                font=("Segoe UI", self.current_font_size)
-            )
+    def _on_root_destroy(self, event):
+        """
+        Write a font size save that is still waiting when the window closes.
 
-        # Apply to Bulk Transcriber tab
-        if hasattr(self, "bulk_transcriber_tab"):
-            self.bulk_transcriber_tab.status_log.configure(
-                font=("Segoe UI", self.current_font_size)
-            )
+        Args:
+            event: Tkinter <Destroy> event (fires for every child widget too)
+        """
+        if event.widget is self.root and self._font_save_id is not None:
+            self.root.after_cancel(self._font_save_id)
+            self._save_pending_font_size()
 
-        # Apply to Translation tab
-        if hasattr(self, "translation_tab"):
-            self.translation_tab.source_text.configure(
-                font=("Segoe UI", self.current_font_size)
-            )
-            self.translation_tab.target_text.configure(
-                font=("Segoe UI", self.current_font_size)
-            )
+    def _apply_font_size(self):
+        """
+        Apply current font size to all text widgets.
 
-        # Apply to Downloader tab
-        if hasattr(self, "downloader_tab"):
-            self.downloader_tab.status_log.configure(
-                font=("Segoe UI", self.current_font_size)
-            )
+        v6.3: Applies to all tabs including Downloader
+        """
+        if self.current_font_size == self._applied_font_size:
+            return
+        self._applied_font_size = self.current_font_size
 
-        # Apply to Video Subtitler tab
-        if hasattr(self, "video_subtitler_tab"):
-            self.video_subtitler_tab.srt_text.configure(
-                font=("Segoe UI", self.current_font_size)
-            )
-            if hasattr(self.video_subtitler_tab, "translated_srt_text"):
-                self.video_subtitler_tab.translated_srt_text.configure(
-                    font=("Segoe UI", self.current_font_size)
-                )
+        # Other tabs' text widgets and the info label use the shared fonts,
+        # so resizing the fonts updates every widget
+        self._text_font.configure(size=self.current_font_size)
+        self._small_font.configure(size=self.current_font_size - 1)
+
+        # Apply to File tab (preview and response share one font object)
+        if hasattr(self, "file_tab"):
+            self.file_tab.set_text_size(self.current_font_size, family=self.FONT_FAMILY)
 
         logger.debug(
-            f"Applied font size {self.current_font_size}px to all text widgets"
+            "Applied font size %spx to all text widgets", self.current_font_size
         )
 
     # Status bar methods
@@ -682,8 +819,19 @@ class MainWindow:
         Args:
             message: Status message
         """
-        self.status_var.set(message)
-        logger.info(f"Status: {message}")
+        logger.info("Status: %s", message)
+
+        # Coalesce bursts of updates into one status bar redraw
+        self._status_pending = message
+        if self._status_timer is None:
+            self._status_timer = self.root.after(
+                self.STATUS_DEBOUNCE_MS, self._flush_status
+            )
+
+    def _flush_status(self):
+        """Show the most recent status message"""
+        self._status_timer = None
+        self.status_label.configure(text=self._status_pending)
 
     # Convenience methods to access current tab
 
@@ -694,19 +842,9 @@ class MainWindow:
         Returns:
             Current tab widget or None
         """
-        tab_index = self.notebook.index(self.notebook.select())
-        if tab_index == 0:
-            return self.file_tab
-        elif tab_index == 1:
-            return self.youtube_summarizer_tab
-        elif tab_index == 2:
-            return self.transcriber_tab
-        elif tab_index == 3:
-            return self.bulk_summarizer_tab
-        elif tab_index == 4:
-            return self.bulk_transcriber_tab
-        elif tab_index == 5:
-            return self.translation_tab
-        elif tab_index == 6:
-            return self.downloader_tab
-        return None
+        try:
+            name = self._tab_names[self.notebook.index("current")]
+        except (tk.TclError, IndexError):
+            return None
+        # Lazy tabs that haven't been built yet have no attribute
+        return getattr(self, name, None)
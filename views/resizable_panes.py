@@ -69,8 +69,7 @@ class ResizablePanes(ttk.Frame):
     def _setup_layout(self):
         """Setup grid layout for panes and separator."""
         # Configure grid
-        self.columnconfigure(0, weight=1)
-        self.columnconfigure(2, weight=1)
+        self.columnconfigure((0, 2), weight=1)  # Both panes in one call
         self.columnconfigure(1, weight=0)  # Separator doesn't expand
         self.rowconfigure(0, weight=1)
 
@@ -0,0 +1,91 @@
+"""
+Cached string width measurement for tkinter fonts.
+
+Every tkfont.Font.measure() call is a round trip into Tk. Code that measures
+many candidate strings (e.g. shortening a path until it fits a label) would
+make one such call per attempt. TextMetrics measures the 128 ASCII characters
+once and sums table entries afterwards, only falling back to Tk for strings
+containing other characters.
+"""
+
+import tkinter.font as tkfont
+from array import array
+
+ELLIPSIS = "…"
+
+
+class TextMetrics:
+    """
+    Pixel width lookups for one font, with an ASCII width table.
+
+    Widths from the table ignore kerning, which is fine for fitting UI
+    labels but not for precise layout.
+
+    Usage:
+        metrics = TextMetrics("TkDefaultFont")
+        label_text = metrics.elide_middle(path, max_width=400)
+    """
+
+    def __init__(self, font):
+        """
+        Build the width table for a font.
+
+        Args:
+            font: Font description accepted by tkinter (name, tuple or Font)
+        """
+        self.font = font if isinstance(font, tkfont.Font) else tkfont.Font(font=font)
+        self._ascii_widths = array("H", [self.font.measure(chr(i)) for i in range(128)])
+        self._ellipsis_width = self.font.measure(ELLIPSIS)
+
+    def width(self, text: str) -> int:
+        """
+        Get the pixel width of a string.
+
+        Args:
+            text: String to measure
+
+        Returns:
+            Width in pixels
+        """
+        if text.isascii():
+            widths = self._ascii_widths
+            return sum(widths[b] for b in text.encode("ascii"))
+        return self.font.measure(text)
+
+    def elide_middle(self, text: str, max_width: int) -> str:
+        """
+        Shorten text with an ellipsis in the middle so it fits max_width.
+
+        Keeps both ends, which for paths means the drive/root and the file
+        name stay visible.
+
+        Args:
+            text: String to fit
+            max_width: Available width in pixels
+
+        Returns:
+            text unchanged if it fits, otherwise a shortened copy
+        """
+        if max_width <= 0 or self.width(text) <= max_width:
+            return text
+
+        budget = max_width - self._ellipsis_width
+        low, high = 0, len(text) - 1
+        # Binary search the number of characters that can be kept
+        while low < high:
+            keep = (low + high + 1) // 2
+            if self.width(_keep_ends(text, keep)) <= budget:
+                low = keep
+            else:
+                high = keep - 1
+
+        head_tail = _keep_ends(text, low)
+        head_len = (low + 1) // 2
+        return head_tail[:head_len] + ELLIPSIS + head_tail[head_len:]
+
+
+def _keep_ends(text: str, keep: int) -> str:
+    """Concatenate the first and last characters of text, keep in total."""
+    head = (keep + 1) // 2
+    tail = keep - head
+    return text[:head] + (text[len(text) - tail :] if tail else "")
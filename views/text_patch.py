@@ -0,0 +1,70 @@
+"""
+Minimal-edit updates for tkinter Text widgets.
+
+Replacing a Text widget's content with delete("1.0", END) + insert() makes Tk
+drop and rebuild its line metadata for the whole document, even when only a
+few characters changed (e.g. a status line appended to a response). Given
+the text the widget currently holds, patch_text only deletes and inserts the
+range between the common prefix and the common suffix.
+"""
+
+import tkinter as tk
+
+
+def patch_text(widget: tk.Text, old: str, new: str):
+    """
+    Turn widget content `old` into `new` with one delete and one insert.
+
+    Args:
+        widget: Text widget currently holding exactly `old`
+        old: Current widget content
+        new: Desired widget content
+    """
+    if not old or not new or not (_is_bmp(old) and _is_bmp(new)):
+        # Tk counts astral characters differently from Python, so
+        # character offsets are only safe for BMP-only text
+        widget.delete("1.0", tk.END)
+        if new:
+            widget.insert("1.0", new)
+        return
+
+    prefix = _common_prefix(old, new)
+    limit = min(len(old), len(new)) - prefix
+    suffix = _common_suffix(old, new, limit)
+
+    start = f"1.0 + {prefix} chars"
+    if len(old) - suffix > prefix:
+        widget.delete(start, f"1.0 + {len(old) - suffix} chars")
+    middle = new[prefix : len(new) - suffix]
+    if middle:
+        widget.insert(start, middle)
+
+
+def _is_bmp(text: str) -> bool:
+    """True if text has no characters outside the Basic Multilingual Plane."""
+    return not text or max(text) <= "\uffff"
+
+
+def _common_prefix(a: str, b: str) -> int:
+    """Length of the common prefix of a and b."""
+    n = min(len(a), len(b))
+    i = 0
+    # Compare in blocks first, then narrow down character by character
+    step = 4096
+    while i + step <= n and a[i : i + step] == b[i : i + step]:
+        i += step
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix of a and b, at most limit characters."""
+    i = 0
+    la, lb = len(a), len(b)
+    step = 4096
+    while i + step <= limit and a[la - i - step : la - i] == b[lb - i - step : lb - i]:
+        i += step
+    while i < limit and a[la - i - 1] == b[lb - i - 1]:
+        i += 1
+    return i
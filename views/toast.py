@@ -0,0 +1,79 @@
+"""
+Non-modal toast notifications for the main window.
+
+messagebox.showinfo/showerror run a nested event loop until the user clicks
+OK, which stalls progress bars, queued root.after() callbacks and background
+result handlers. A toast is a plain Label placed over the bottom of the window
+that hides itself after a timeout, so the main loop keeps running.
+"""
+
+import tkinter as tk
+
+
+class Toast:
+    """
+    Transient message shown over the bottom edge of a window.
+
+    The Label is only created on first use. Showing a new message replaces the
+    current one and restarts its timer.
+
+    Usage:
+        toast = Toast(root)
+        toast.show("Saved!")
+        toast.show("Something failed", kind="error")
+    """
+
+    DURATION_MS = 3000
+    ERROR_DURATION_MS = 6000  # Errors stay up longer so they can be read
+
+    COLORS = {
+        "success": ("#e6f4ea", "#1e4620"),
+        "error": ("#fce8e6", "#8a1c12"),
+        "info": ("#ffffdd", "#1f2329"),
+    }
+
+    def __init__(self, root: tk.Misc):
+        """
+        Initialize toast for a window.
+
+        Args:
+            root: Window the toast is placed over (usually the tk.Tk root)
+        """
+        self.root = root
+        self._label = None
+        self._hide_id = None
+
+    def show(self, message: str, kind: str = "info"):
+        """
+        Show a message, replacing any toast currently visible.
+
+        Args:
+            message: Text to display
+            kind: 'success', 'error' or 'info' (selects colors and duration)
+        """
+        if self._label is None:
+            self._label = tk.Label(
+                self.root,
+                relief=tk.SOLID,
+                bd=1,
+                padx=12,
+                pady=6,
+                justify=tk.LEFT,
+                wraplength=600,
+            )
+
+        bg, fg = self.COLORS.get(kind, self.COLORS["info"])
+        self._label.config(text=message, bg=bg, fg=fg)
+        self._label.place(relx=0.5, rely=1.0, y=-36, anchor=tk.S)
+        self._label.lift()
+
+        if self._hide_id is not None:
+            self.root.after_cancel(self._hide_id)
+        duration = self.ERROR_DURATION_MS if kind == "error" else self.DURATION_MS
+        self._hide_id = self.root.after(duration, self.hide)
+
+    def hide(self):
+        """Hide the toast if it is visible."""
+        self._hide_id = None
+        if self._label is not None:
+            self._label.place_forget()
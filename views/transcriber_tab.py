@@ -18,6 +18,10 @@ Version: 2.4
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from views.base_tab import BaseTab
+from views.incremental_text import IncrementalText
+
+# Grid options shared by the stacked option sections (device, output, formats)
+_SECTION_GRID = {"column": 0, "sticky": (tk.W, tk.E), "padx": 10, "pady": (5, 0)}
 
 
 class TranscriberTab(BaseTab):
@@ -34,6 +38,14 @@ class TranscriberTab(BaseTab):
     - Proper window resizing
     """
     
+    STATUS_DEBOUNCE_MS = 50
+    LONG_LINE_CHARS = 2000  # Longer lines switch the transcript to wrap=CHAR
+    
+    MEDIA_FILETYPES = (
+        ("Media Files", "*.mp4 *.avi *.mov *.mkv *.mp3 *.wav *.flac *.m4a"),
+        ("All Files", "*.*"),
+    )
+    
     def __init__(self, parent, settings_manager=None):
         """
         Initialize Transcriber tab.
@@ -66,6 +78,25 @@ class TranscriberTab(BaseTab):
         self.keep_vtt_var = tk.BooleanVar(value=False)
         self.keep_json_var = tk.BooleanVar(value=False)
         self.keep_tsv_var = tk.BooleanVar(value=False)
+        self._format_vars = (
+            (self.keep_txt_var, '.txt'),
+            (self.keep_srt_var, '.srt'),
+            (self.keep_vtt_var, '.vtt'),
+            (self.keep_json_var, '.json'),
+            (self.keep_tsv_var, '.tsv'),
+        )
+        
+        # Latest status message, the text on the label and the flush timer
+        self._status_pending = "Ready"
+        self._status_shown = "Ready"
+        self._status_timer = None
+        
+        # Transcript set while the tab was hidden, written to the widget
+        # when the tab is next shown
+        self._deferred_transcript = None
+        
+        # Whether the loading indicator is currently shown
+        self._loading = False
         
         # Now call parent init (which calls _setup_ui())
         super().__init__(parent, "Transcriber")
@@ -78,6 +109,10 @@ class TranscriberTab(BaseTab):
         self.on_export_srt_clicked = None
         self.on_clear_clicked = None
         
+        # The notebook maps and unmaps the page frame this tab is gridded in,
+        # not this frame, so watch the page for the tab being shown again
+        self.master.bind("<Map>", self._flush_deferred_transcript, add="+")
+        
     def _setup_ui(self):
         """Setup transcriber tab UI with proper resizing"""
         self.columnconfigure(0, weight=1)
@@ -157,8 +192,13 @@ class TranscriberTab(BaseTab):
         )
         self.browse_btn.grid(row=0, column=2, padx=5)
         
-        # YouTube URL section (hidden by default)
-        self.youtube_frame = ttk.Frame(input_frame)
+        # YouTube URL section (built when YouTube mode is first selected)
+        self._input_frame = input_frame
+        self.youtube_frame = None
+    
+    def _build_youtube_frame(self):
+        """Create the YouTube URL input (hidden until gridded)"""
+        self.youtube_frame = ttk.Frame(self._input_frame)
         ttk.Label(self.youtube_frame, text="URL:").grid(row=0, column=0, sticky=tk.W)
         self.url_entry = ttk.Entry(self.youtube_frame, textvariable=self.url_var)
         self.url_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5)
@@ -168,7 +208,7 @@ class TranscriberTab(BaseTab):
         """Setup device selection (reduced padding)"""
         device_frame = ttk.LabelFrame(self, text="Device", padding="10")
         # Reduced pady below input
-        device_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), padx=10, pady=(5, 0))
+        device_frame.grid(row=2, **_SECTION_GRID)
         device_frame.columnconfigure(1, weight=1)
         
         devices = [
@@ -189,7 +229,7 @@ class TranscriberTab(BaseTab):
     def _setup_output_location_section(self):
         """Setup output location selection"""
         output_loc_frame = ttk.LabelFrame(self, text="Output Location", padding="10")
-        output_loc_frame.grid(row=3, column=0, sticky=(tk.W, tk.E), padx=10, pady=(5, 0))
+        output_loc_frame.grid(row=3, **_SECTION_GRID)
         output_loc_frame.columnconfigure(1, weight=1)
         
         ttk.Radiobutton(
@@ -208,8 +248,15 @@ class TranscriberTab(BaseTab):
             command=self._toggle_output_location
         ).grid(row=0, column=1, sticky=tk.W, padx=10)
         
-        # Custom path selection (initially hidden)
-        self.custom_path_frame = ttk.Frame(output_loc_frame)
+        # Custom path selection (built when a custom destination is chosen)
+        self._output_loc_frame = output_loc_frame
+        self.custom_path_frame = None
+        if self.output_location_var.get() == "custom":
+            self._build_custom_path_frame()
+    
+    def _build_custom_path_frame(self):
+        """Create and show the custom output path row"""
+        self.custom_path_frame = ttk.Frame(self._output_loc_frame)
         self.custom_path_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 0))
         self.custom_path_frame.columnconfigure(1, weight=1)
         
@@ -223,12 +270,11 @@ class TranscriberTab(BaseTab):
             command=self._browse_output_folder
         )
         self.browse_output_btn.grid(row=0, column=2, padx=5)
-        self.custom_path_frame.grid_remove()  # Hide initially
     
     def _setup_format_selection_section(self):
         """Setup file format selection checkboxes"""
         format_frame = ttk.LabelFrame(self, text="Output Formats", padding="10")
-        format_frame.grid(row=4, column=0, sticky=(tk.W, tk.E), padx=10, pady=(5, 0))
+        format_frame.grid(row=4, **_SECTION_GRID)
         format_frame.columnconfigure(2, weight=1)
         
         ttk.Checkbutton(
@@ -315,7 +361,10 @@ class TranscriberTab(BaseTab):
         
         scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.transcript_text.yview)
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.transcript_text.configure(yscrollcommand=scrollbar.set)
+        
+        # Long transcripts are materialized in chunks as the user scrolls;
+        # the loader drives the scrollbar
+        self._transcript_loader = IncrementalText(self.transcript_text, scrollbar=scrollbar)
     
     def _setup_action_bar(self):
         """Setup action buttons"""
@@ -350,16 +399,22 @@ class TranscriberTab(BaseTab):
         mode = self.mode_var.get()
         if mode == "local":
             self.local_frame.grid()
-            self.youtube_frame.grid_remove()
+            if self.youtube_frame is not None:
+                self.youtube_frame.grid_remove()
         else:
             self.local_frame.grid_remove()
+            if self.youtube_frame is None:
+                self._build_youtube_frame()
             self.youtube_frame.grid(row=0, column=0, columnspan=3, sticky=(tk.W, tk.E))
     
     def _toggle_output_location(self):
         """Toggle custom output location field and save preference"""
         if self.output_location_var.get() == "custom":
-            self.custom_path_frame.grid()
-        else:
+            if self.custom_path_frame is None:
+                self._build_custom_path_frame()
+            else:
+                self.custom_path_frame.grid()
+        elif self.custom_path_frame is not None:
             self.custom_path_frame.grid_remove()
         
         # Save output location preference
@@ -368,13 +423,9 @@ class TranscriberTab(BaseTab):
     
     def _browse_file(self):
         """Browse for local file"""
-        supported_formats = [
-            ("Media Files", "*.mp4 *.avi *.mov *.mkv *.mp3 *.wav *.flac *.m4a"),
-            ("All Files", "*.*")
-        ]
         file_path = filedialog.askopenfilename(
             title="Select media file",
-            filetypes=supported_formats
+            filetypes=self.MEDIA_FILETYPES
         )
         if file_path:
             self.file_path_var.set(file_path)
@@ -443,34 +494,63 @@ class TranscriberTab(BaseTab):
     
     def get_keep_formats(self) -> list:
         """Get list of formats to keep"""
-        formats = []
-        if self.keep_txt_var.get():
-            formats.append('.txt')
-        if self.keep_srt_var.get():
-            formats.append('.srt')
-        if self.keep_vtt_var.get():
-            formats.append('.vtt')
-        if self.keep_json_var.get():
-            formats.append('.json')
-        if self.keep_tsv_var.get():
-            formats.append('.tsv')
-        return formats
+        return [ext for var, ext in self._format_vars if var.get()]
     
     def set_transcript(self, content: str):
-        """Set transcript text"""
-        self.transcript_text.delete('1.0', tk.END)
-        self.transcript_text.insert('1.0', content)
+        """Set transcript text (deferred while the tab is hidden)"""
+        if self.winfo_viewable():
+            self._deferred_transcript = None
+            self._write_transcript(content)
+        else:
+            self._deferred_transcript = content or ""
+    
+    def _flush_deferred_transcript(self, event=None):
+        """Write a transcript set while hidden into the widget"""
+        if self._deferred_transcript is not None:
+            content, self._deferred_transcript = self._deferred_transcript, None
+            self._write_transcript(content)
+    
+    def _write_transcript(self, content: str):
+        """
+        Load a transcript into the widget and pick its wrap mode.
+        
+        SRT cues are short lines, but plain-text transcripts can be one huge
+        line; word wrapping has to search such a line for break points, so
+        it is wrapped at character boundaries instead.
+        
+        Args:
+            content: Transcript text
+        """
+        loader = self._transcript_loader
+        loader.set(content)
+        wrap = tk.CHAR if loader.longest_line > self.LONG_LINE_CHARS else tk.WORD
+        if str(self.transcript_text.cget("wrap")) != wrap:
+            self.transcript_text.configure(wrap=wrap)
     
     def get_transcript(self) -> str:
-        """Get current transcript"""
-        return self.transcript_text.get('1.0', tk.END).rstrip()
+        """Get current transcript, including lines not yet loaded"""
+        if self._deferred_transcript is not None:
+            return self._deferred_transcript.rstrip()
+        return self._transcript_loader.get().rstrip()
     
     def set_status(self, message: str):
-        """Set status message"""
-        self.status_label.configure(text=message)
+        """Set status message (bursts are coalesced into one redraw)"""
+        self._status_pending = message
+        if self._status_timer is None:
+            self._status_timer = self.after(self.STATUS_DEBOUNCE_MS, self._flush_status)
+    
+    def _flush_status(self):
+        """Show the most recent status message"""
+        self._status_timer = None
+        if self._status_pending != self._status_shown:
+            self._status_shown = self._status_pending
+            self.status_label.configure(text=self._status_pending)
     
     def show_loading(self, show: bool = True):
         """Show/hide loading indicator"""
+        if show == self._loading:
+            return  # Already in that state, skip the configure calls
+        self._loading = show
         if show:
             self.loading_label.configure(text="⏳ Transcribing...")
             self.transcribe_btn.configure(state="disabled")
@@ -482,7 +562,7 @@ class TranscriberTab(BaseTab):
         """Clear all data"""
         self.file_path_var.set("")
         self.url_var.set("")
-        self.transcript_text.delete('1.0', tk.END)
+        self.set_transcript("")
         self.set_status("Cleared")
         self.copy_status.configure(text="")
     
@@ -490,13 +570,12 @@ class TranscriberTab(BaseTab):
         """Copy transcript to clipboard"""
         try:
             content = self.get_transcript()
-            if not content.strip():
+            if not content:  # Already rstripped, so whitespace-only is empty
                 self.show_error("No transcript to copy")
                 return False
             
             self.clipboard_clear()
             self.clipboard_append(content)
-            self.update()
             
             self.copy_status.configure(text="✓ Copied!")
             return True
@@ -14,15 +14,21 @@ Follows the same pattern as other tabs in the project.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from pathlib import Path
 
 from views.base_tab import BaseTab
+from views.incremental_text import IncrementalText
 from views.resizable_panes import ResizablePanes
 
 
 class TranslationTab(BaseTab):
     """Translation workflow UI (pure view, no business logic)."""
 
+    # All Files first: the loader reads any text file, so it stays the default
+    FILE_TYPES = (
+        ("All Files", "*.*"),
+        ("Subtitle and Text Files", "*.srt *.vtt *.txt"),
+    )
+
     def __init__(self, notebook):
         self.notebook = notebook
 
@@ -118,7 +124,9 @@ class TranslationTab(BaseTab):
 
         source_scroll = ttk.Scrollbar(source_frame, command=self.source_text.yview)
         source_scroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.source_text.configure(yscrollcommand=source_scroll.set)
+
+        # Large source files are materialized in chunks as the user scrolls
+        self._source_loader = IncrementalText(self.source_text, scrollbar=source_scroll)
 
         # Setup right pane (Translation text)
         target_frame = ttk.LabelFrame(self.panes.right_pane, text="Translation")
@@ -154,9 +162,8 @@ class TranslationTab(BaseTab):
         self.source_file_path.set(file_path)
 
     def set_source_text(self, text: str):
-        """Set source text content"""
-        self.source_text.delete("1.0", tk.END)
-        self.source_text.insert(tk.END, text)
+        """Set source text content (long files are loaded in chunks)"""
+        self._source_loader.set(text)
 
     def set_target_text(self, text: str):
         """Set translated text content"""
@@ -205,7 +212,9 @@ class TranslationTab(BaseTab):
         if self.is_translating.get():
             return
 
-        file_path = filedialog.askopenfilename(title="Select file to translate")
+        file_path = filedialog.askopenfilename(
+            title="Select file to translate", filetypes=self.FILE_TYPES
+        )
         if file_path:
             if self.on_file_selected:
                 self.on_file_selected(file_path)
@@ -223,8 +232,8 @@ class TranslationTab(BaseTab):
     # --- Getter Methods (used by controller) ---
 
     def get_source_text(self) -> str:
-        """Get current source text content"""
-        return self.source_text.get("1.0", tk.END).strip()
+        """Get current source text content, including lines not yet loaded"""
+        return self._source_loader.get().strip()
 
     def get_webhook_url(self) -> str:
         """Get current webhook URL"""
@@ -368,7 +377,7 @@ class TranslationTab(BaseTab):
 
     def clear_all(self):
         """Clear source/target text and reset file path."""
-        self.source_text.delete("1.0", tk.END)
+        self._source_loader.set("")
         self.target_text.delete("1.0", tk.END)
         self.source_file_path.set("[No file selected]")
         self.set_status("")
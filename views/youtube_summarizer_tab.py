@@ -23,8 +23,10 @@ Updated: 2025-12-07 (v3.1 - .srt to .docx, Transcribe to Summarize)
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox
 from views.base_tab import BaseTab
+from views.toast import Toast
 
 
 class YouTubeSummarizerTab(BaseTab):
@@ -43,6 +45,8 @@ class YouTubeSummarizerTab(BaseTab):
     - Forwards transcript to Transcriber tab
     """
 
+    PLACEHOLDER = "Enter a YouTube URL and click Summarize to get started..."
+
     def __init__(self, notebook):
         """
         Initialize YouTube Summarizer tab.
@@ -62,6 +66,18 @@ class YouTubeSummarizerTab(BaseTab):
         self.on_copy_clipboard_clicked = None
         self.on_clear_clicked = None
 
+        # (message, color) currently shown by each status label
+        self._shown_status = {"input": ("Ready", "green"), "output": ("", "blue")}
+
+        # Current enabled state of the summarize button, format selector and
+        # export buttons
+        self._summarize_enabled = True
+        self._format_enabled = True
+        self._export_enabled = False
+
+        # In-window notifications (created on first message)
+        self._toast = None
+
         # Setup UI
         self._setup_ui()
 
@@ -115,14 +131,14 @@ class YouTubeSummarizerTab(BaseTab):
             row=0, column=2, sticky=tk.W, padx=(0, 5)
         )
         self.format_var = tk.StringVar(value=".txt")
-        format_combo = ttk.Combobox(
+        self.format_combo = ttk.Combobox(
             input_frame,
             textvariable=self.format_var,
             values=[".txt", ".srt", ".vtt", ".json"],
             state="readonly",
             width=10,
         )
-        format_combo.grid(row=0, column=3, sticky=tk.W, padx=(0, 10))
+        self.format_combo.grid(row=0, column=3, sticky=tk.W, padx=(0, 10))
 
         # Summarize button (changed from Transcribe in v3.1)
         self.summarize_btn = ttk.Button(
@@ -130,13 +146,14 @@ class YouTubeSummarizerTab(BaseTab):
         )
         self.summarize_btn.grid(row=0, column=4, sticky=tk.W)
 
-        # Status label
+        # Status label (font object shared with the output status label)
+        self._status_font = tkfont.Font(root=self.root, family="Segoe UI", size=9)
         self.input_status_var = tk.StringVar(value="Ready")
         self.input_status_label = ttk.Label(
             input_frame,
             textvariable=self.input_status_var,
             foreground="green",
-            font=("Segoe UI", 9),
+            font=self._status_font,
         )
         self.input_status_label.grid(
             row=1, column=0, columnspan=5, sticky=tk.W, pady=(5, 0)
@@ -173,9 +190,7 @@ class YouTubeSummarizerTab(BaseTab):
         scrollbar.config(command=self.summary_text.yview)
 
         # Display placeholder
-        self.summary_text.insert(
-            tk.END, "Enter a YouTube URL and click Summarize to get started..."
-        )
+        self.summary_text.insert(tk.END, self.PLACEHOLDER)
         self.summary_text.config(state=tk.DISABLED)
 
         # Register context menu for paste functionality
@@ -228,7 +243,7 @@ class YouTubeSummarizerTab(BaseTab):
             output_frame,
             textvariable=self.output_status_var,
             foreground="blue",
-            font=("Segoe UI", 9),
+            font=self._status_font,
         )
         self.output_status_label.grid(row=2, column=0, sticky=tk.W, pady=(5, 0))
 
@@ -270,16 +285,12 @@ class YouTubeSummarizerTab(BaseTab):
         """
         self.url_var.set("https://")
         self.format_var.set(".txt")
-        self.summary_text.config(state=tk.NORMAL)
-        self.summary_text.delete("1.0", tk.END)
-        self.summary_text.insert(
-            tk.END, "Enter a YouTube URL and click Summarize to get started..."
-        )
-        self.summary_text.config(state=tk.DISABLED)
+        self._show_placeholder()
         self.set_input_status("Ready", "green")
         self.set_output_status("", "blue")
         self.set_export_buttons_enabled(False)
         self.set_summarize_button_enabled(True)
+        self.set_format_enabled(True)
 
     # Getters
 
@@ -319,10 +330,10 @@ class YouTubeSummarizerTab(BaseTab):
         Args:
             content: Summary text to display
         """
+        # Leaves the widget editable for user adjustments
         self.summary_text.config(state=tk.NORMAL)
         self.summary_text.delete("1.0", tk.END)
         self.summary_text.insert(tk.END, content)
-        self.summary_text.config(state=tk.NORMAL)  # Keep editable for user adjustments
 
     def _paste_forwarded_text(self):
         """Paste forwarded text from translation tab."""
@@ -331,20 +342,16 @@ class YouTubeSummarizerTab(BaseTab):
         if main_window and hasattr(main_window, "translation_tab"):
             forwarded_text = main_window.translation_tab.get_forwarded_text()
             if forwarded_text:
-                self.summary_text.config(state=tk.NORMAL)
+                self.summary_text.config(state=tk.NORMAL)  # Keep editable
                 self.summary_text.delete("1.0", tk.END)
                 self.summary_text.insert(tk.END, forwarded_text)
-                self.summary_text.config(state=tk.NORMAL)  # Keep editable
-                messagebox.showinfo(
-                    title="Pasted",
-                    message=f"Pasted {len(forwarded_text)} characters from translation tab",
+                self._show_toast(
+                    f"Pasted {len(forwarded_text)} characters from translation tab",
+                    "success",
                 )
                 return
 
-        messagebox.showinfo(
-            title="No Forwarded Text",
-            message="No forwarded text available from translation tab",
-        )
+        self._show_toast("No forwarded text available from translation tab", "info")
 
     def _copy_all_text(self):
         """Copy all text from summary to clipboard."""
@@ -352,23 +359,22 @@ class YouTubeSummarizerTab(BaseTab):
         if content:
             self.root.clipboard_clear()
             self.root.clipboard_append(content)
-            messagebox.showinfo(
-                title="Copied", message=f"Copied {len(content)} characters to clipboard"
-            )
+            self._show_toast(f"Copied {len(content)} characters to clipboard", "success")
         else:
-            messagebox.showinfo(
-                title="Nothing to Copy", message="Summary text is empty"
-            )
+            self._show_toast("Summary text is empty", "info")
 
     def _clear_content(self):
         """Clear summary content."""
-        self.summary_text.config(state=tk.NORMAL)
+        self._show_placeholder()
+        self._show_toast("Summary content cleared", "success")
+
+    def _show_placeholder(self):
+        """Replace the summary with the read-only placeholder text."""
+        if str(self.summary_text.cget("state")) == tk.DISABLED:
+            return  # Only the placeholder is shown read-only, nothing to redraw
         self.summary_text.delete("1.0", tk.END)
-        self.summary_text.insert(
-            tk.END, "Enter a YouTube URL and click Summarize to get started..."
-        )
+        self.summary_text.insert(tk.END, self.PLACEHOLDER)
         self.summary_text.config(state=tk.DISABLED)
-        messagebox.showinfo(title="Cleared", message="Summary content cleared")
 
     def set_input_status(self, message: str, color: str = "blue"):
         """
@@ -378,8 +384,13 @@ class YouTubeSummarizerTab(BaseTab):
             message: Status message
             color: Text color (blue=info, green=success, red=error)
         """
-        self.input_status_var.set(message)
-        self.input_status_label.config(foreground=color)
+        shown_message, shown_color = self._shown_status["input"]
+        if message != shown_message:
+            self.input_status_var.set(message)
+        if color != shown_color:
+            # Only restyle when the color changes; most updates keep it
+            self.input_status_label.config(foreground=color)
+        self._shown_status["input"] = (message, color)
 
     def set_output_status(self, message: str, color: str = "blue"):
         """
@@ -389,8 +400,13 @@ class YouTubeSummarizerTab(BaseTab):
             message: Status message
             color: Text color (blue=info, green=success, red=error)
         """
-        self.output_status_var.set(message)
-        self.output_status_label.config(foreground=color)
+        shown_message, shown_color = self._shown_status["output"]
+        if message != shown_message:
+            self.output_status_var.set(message)
+        if color != shown_color:
+            # Only restyle when the color changes; most updates keep it
+            self.output_status_label.config(foreground=color)
+        self._shown_status["output"] = (message, color)
 
     def set_summarize_button_enabled(self, enabled: bool):
         """
@@ -399,9 +415,24 @@ class YouTubeSummarizerTab(BaseTab):
         Args:
             enabled: True to enable, False to disable
         """
+        if enabled == self._summarize_enabled:
+            return
+        self._summarize_enabled = enabled
         state = tk.NORMAL if enabled else tk.DISABLED
         self.summarize_btn.config(state=state)
 
+    def set_format_enabled(self, enabled: bool):
+        """
+        Enable/disable the transcription format selector.
+
+        Args:
+            enabled: True to enable, False to disable
+        """
+        if enabled == self._format_enabled:
+            return
+        self._format_enabled = enabled
+        self.format_combo.config(state="readonly" if enabled else tk.DISABLED)
+
     def set_export_buttons_enabled(self, enabled: bool):
         """
         Enable/disable all export buttons.
@@ -409,10 +440,12 @@ class YouTubeSummarizerTab(BaseTab):
         Args:
             enabled: True to enable, False to disable
         """
+        if enabled == self._export_enabled:
+            return  # Skip three configure calls when nothing changes
+        self._export_enabled = enabled
         state = tk.NORMAL if enabled else tk.DISABLED
-        self.export_txt_btn.config(state=state)
-        self.export_docx_btn.config(state=state)
-        self.copy_btn.config(state=state)
+        for button in (self.export_txt_btn, self.export_docx_btn, self.copy_btn):
+            button.config(state=state)
 
     def show_error(self, message: str):
         """
@@ -421,8 +454,8 @@ class YouTubeSummarizerTab(BaseTab):
         Args:
             message: Error message
         """
-        messagebox.showerror("Error", message)
         self.set_input_status("Error", "red")
+        self._show_toast(message, "error")
 
     def show_success(self, message: str):
         """
@@ -431,7 +464,7 @@ class YouTubeSummarizerTab(BaseTab):
         Args:
             message: Success message
         """
-        messagebox.showinfo("Success", message)
+        self._show_toast(message, "success")
 
     def show_info(self, title: str, message: str):
         """
@@ -442,3 +475,9 @@ class YouTubeSummarizerTab(BaseTab):
             message: Message text
         """
         messagebox.showinfo(title, message)
+
+    def _show_toast(self, message: str, kind: str):
+        """Show a non-modal notification over the window"""
+        if self._toast is None:
+            self._toast = Toast(self.root or self.winfo_toplevel())
+        self._toast.show(message, kind)